@@ -2,53 +2,50 @@
 VLA Android Scripts Package
 """
 
-from .config import (
-    VLLM_BASE_URL,
-    VLLM_API_KEY,
-    VLM_MODEL,
-    LLM_MODEL,
-    VLM_CONFIG,
-    LLM_CONFIG,
-    VLA_CONFIG,
-    IMAGE_CONFIG,
-    SCREENSHOT_DIR,
-)
+import importlib
 
-from .perception import (
-    Perception,
-    UIState,
-    UIElement,
-    analyze_screen,
-    get_screen_elements,
-)
-
-from .executor import (
-    Executor,
-    Action,
-    ActionType,
-    ActionResult,
-    tap_at,
-    input_text,
-    go_back,
-    go_home,
-)
-
-from .planner import (
-    Planner,
-    PlannerContext,
-    plan_action,
-    is_task_complete,
-)
-
-from .vla_loop import (
-    VLAAgent,
-    AgentStatus,
-    AgentResult,
-    StepRecord,
-    run_task,
-    open_app_and_search,
-    install_app_from_play_store,
-)
+# Public name -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
+    # Config
+    "VLLM_BASE_URL": (".config", "VLLM_BASE_URL"),
+    "VLLM_API_KEY": (".config", "VLLM_API_KEY"),
+    "VLM_MODEL": (".config", "VLM_MODEL"),
+    "LLM_MODEL": (".config", "LLM_MODEL"),
+    "VLM_CONFIG": (".config", "VLM_CONFIG"),
+    "LLM_CONFIG": (".config", "LLM_CONFIG"),
+    "VLA_CONFIG": (".config", "VLA_CONFIG"),
+    "IMAGE_CONFIG": (".config", "IMAGE_CONFIG"),
+    "SCREENSHOT_DIR": (".config", "SCREENSHOT_DIR"),
+    # Perception
+    "Perception": (".perception", "Perception"),
+    "UIState": (".perception", "UIState"),
+    "UIElement": (".perception", "UIElement"),
+    "analyze_screen": (".perception", "analyze_screen"),
+    "get_screen_elements": (".perception", "get_screen_elements"),
+    # Executor
+    "Executor": (".executor", "Executor"),
+    "Action": (".executor", "Action"),
+    "ActionType": (".executor", "ActionType"),
+    "ActionResult": (".executor", "ActionResult"),
+    "tap_at": (".executor", "tap_at"),
+    "input_text": (".executor", "input_text"),
+    "go_back": (".executor", "go_back"),
+    "go_home": (".executor", "go_home"),
+    # Planner
+    "Planner": (".planner", "Planner"),
+    "PlannerContext": (".planner", "PlannerContext"),
+    "plan_action": (".planner", "plan_action"),
+    "is_task_complete": (".planner", "is_task_complete"),
+    # VLA Loop
+    "VLAAgent": (".vla_loop", "VLAAgent"),
+    "AgentStatus": (".vla_loop", "AgentStatus"),
+    "AgentResult": (".vla_loop", "AgentResult"),
+    "StepRecord": (".vla_loop", "StepRecord"),
+    "run_task": (".vla_loop", "run_task"),
+    "open_app_and_search": (".vla_loop", "open_app_and_search"),
+    "install_app_from_play_store": (".vla_loop", "install_app_from_play_store"),
+}
 
 __all__ = [
     # Config
@@ -90,3 +87,16 @@ __all__ = [
     "open_app_and_search",
     "install_app_from_play_store",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value  # Cache so __getattr__ is not hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -1,23 +1,32 @@
-cat > ~/.deepagents/agent/skills/confluence/__init__.py << 'EOF'
 """
 Confluence Skill for DeepAgents
 
 Provides native Confluence access via MCP server.
-Tools are automatically loaded when imported.
+Tools are loaded on the first call to get_confluence_tools(), so importing
+the skill package stays cheap.
 
 Usage:
     from deepagents_skills.confluence import get_confluence_tools
     tools = get_confluence_tools()
 """
 
+import functools
 import os
 import sys
 
-# Add skill directory to path
 SKILL_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, SKILL_DIR)
 
-from mcp_client import get_confluence_mcp_tools
+
+@functools.lru_cache(maxsize=1)
+def _load_confluence_tools() -> tuple:
+    """Import the MCP client and build its tools (failures are not cached)."""
+    # mcp_client lives next to this file rather than in an installed package
+    if SKILL_DIR not in sys.path:
+        sys.path.insert(0, SKILL_DIR)
+    
+    from mcp_client import get_confluence_mcp_tools
+    
+    return tuple(get_confluence_mcp_tools())
 
 
 def get_confluence_tools():
@@ -27,13 +36,10 @@ def get_confluence_tools():
     Returns LangChain tools that communicate with the Confluence MCP server.
     """
     try:
-        return get_confluence_mcp_tools()
+        return list(_load_confluence_tools())
     except Exception as e:
         print(f"[Confluence] Warning: Could not load tools: {e}")
         return []
 
 
 __all__ = ["get_confluence_tools"]
-EOF
-
-echo "✅ __init__.py created for confluence skill"
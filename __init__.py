@@ -1,54 +1,58 @@
 """Android Tools Module"""
 
-from .adb_client import ADBClient
-from .device_manager import (
-    DeviceManager,
-    list_android_devices,
-    get_device_info,
-    get_device_battery_info,
-    reboot_device,
-    get_device_screen_info,
-)
-from .app_control import (
-    AppController,
-    list_installed_packages,
-    get_app_info,
-    install_apk,
-    uninstall_app,
-    start_app,
-    stop_app,
-    clear_app_data,
-)
-from .file_ops import (
-    FileManager,
-    list_files,
-    pull_file,
-    push_file,
-    delete_file,
-    create_directory,
-    file_exists,
-    read_file,
-    write_file,
-    file_stats,
-    list_app_databases,
-    pull_app_database,
-)
-from .diagnostics import (
-    DiagnosticsManager,
-    take_screenshot,
-    get_logcat,
-    capture_bugreport,
-)
-from .ui_automation import (
-    UIAutomation,
-    tap,
-    long_press,
-    swipe,
-    drag,
-    input_text,
-    press_key,
-    get_ui_hierarchy,
-)
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
+    # ADB Client
+    'ADBClient': ('.adb_client', 'ADBClient'),
+    # Device Manager (5)
+    'DeviceManager': ('.device_manager', 'DeviceManager'),
+    'list_android_devices': ('.device_manager', 'list_android_devices'),
+    'get_device_info': ('.device_manager', 'get_device_info'),
+    'get_device_battery_info': ('.device_manager', 'get_device_battery_info'),
+    'reboot_device': ('.device_manager', 'reboot_device'),
+    'get_device_screen_info': ('.device_manager', 'get_device_screen_info'),
+    # App Control (7)
+    'AppController': ('.app_control', 'AppController'),
+    'list_installed_packages': ('.app_control', 'list_installed_packages'),
+    'get_app_info': ('.app_control', 'get_app_info'),
+    'install_apk': ('.app_control', 'install_apk'),
+    'uninstall_app': ('.app_control', 'uninstall_app'),
+    'start_app': ('.app_control', 'start_app'),
+    'stop_app': ('.app_control', 'stop_app'),
+    'clear_app_data': ('.app_control', 'clear_app_data'),
+    # File Operations (12)
+    'FileManager': ('.file_ops', 'FileManager'),
+    'list_files': ('.file_ops', 'list_files'),
+    'pull_file': ('.file_ops', 'pull_file'),
+    'push_file': ('.file_ops', 'push_file'),
+    'push_files': ('.file_ops', 'push_files'),
+    'delete_file': ('.file_ops', 'delete_file'),
+    'create_directory': ('.file_ops', 'create_directory'),
+    'file_exists': ('.file_ops', 'file_exists'),
+    'read_file': ('.file_ops', 'read_file'),
+    'write_file': ('.file_ops', 'write_file'),
+    'file_stats': ('.file_ops', 'file_stats'),
+    'list_app_databases': ('.file_ops', 'list_app_databases'),
+    'pull_app_database': ('.file_ops', 'pull_app_database'),
+    # Diagnostics (4)
+    'DiagnosticsManager': ('.diagnostics', 'DiagnosticsManager'),
+    'take_screenshot': ('.diagnostics', 'take_screenshot'),
+    'get_logcat': ('.diagnostics', 'get_logcat'),
+    'capture_bugreport': ('.diagnostics', 'capture_bugreport'),
+    'get_task_status': ('.diagnostics', 'get_task_status'),
+    # UI Automation (7)
+    'UIAutomation': ('.ui_automation', 'UIAutomation'),
+    'tap': ('.ui_automation', 'tap'),
+    'long_press': ('.ui_automation', 'long_press'),
+    'swipe': ('.ui_automation', 'swipe'),
+    'drag': ('.ui_automation', 'drag'),
+    'input_text': ('.ui_automation', 'input_text'),
+    'press_key': ('.ui_automation', 'press_key'),
+    'get_ui_hierarchy': ('.ui_automation', 'get_ui_hierarchy'),
+}
 
 __all__ = [
     # ADB Client
@@ -69,11 +73,12 @@ __all__ = [
     'start_app',
     'stop_app',
     'clear_app_data',
-    # File Operations (11)
+    # File Operations (12)
     'FileManager',
     'list_files',
     'pull_file',
     'push_file',
+    'push_files',
     'delete_file',
     'create_directory',
     'file_exists',
@@ -82,11 +87,12 @@ __all__ = [
     'file_stats',
     'list_app_databases',
     'pull_app_database',
-    # Diagnostics (3)
+    # Diagnostics (4)
     'DiagnosticsManager',
     'take_screenshot',
     'get_logcat',
     'capture_bugreport',
+    'get_task_status',
     # UI Automation (7)
     'UIAutomation',
     'tap',
@@ -97,3 +103,16 @@ __all__ = [
     'press_key',
     'get_ui_hierarchy',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value  # Cache so __getattr__ is not hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -0,0 +1,23 @@
+"""JSON encoding for tool results (uses orjson when it is installed)."""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json works the same, just slower
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a tool result to a compact JSON string.
+    
+    Args:
+        obj: JSON-compatible object
+    
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
@@ -0,0 +1,43 @@
+"""Lazy module-level objects (modelled on lazyasd's LazyObject)."""
+from typing import Any, Callable, Dict
+
+
+class LazyObject:
+    """
+    Placeholder that builds its real object on first attribute access.
+    
+    Useful for module-level constants such as compiled regexes: nothing is
+    built at import time, and once loaded the placeholder swaps itself out of
+    the module namespace so later lookups hit the real object directly.
+    
+    Example:
+        _LEVEL_RE = LazyObject(lambda: re.compile(r"level:\\s*(\\d+)"), globals(), "_LEVEL_RE")
+    """
+    
+    def __init__(self, load: Callable[[], Any], ctx: Dict[str, Any], name: str):
+        """
+        Initialize the placeholder.
+        
+        Args:
+            load: Zero-argument callable that builds the real object
+            ctx: Namespace holding the placeholder (usually ``globals()``)
+            name: Name the placeholder is bound to in ctx
+        """
+        self._lazy = {"load": load, "ctx": ctx, "name": name, "obj": None}
+    
+    def _load(self) -> Any:
+        """Build the real object once and rebind it in its namespace."""
+        state = object.__getattribute__(self, "_lazy")
+        obj = state["obj"]
+        if obj is None:
+            obj = state["obj"] = state["load"]()
+            state["ctx"][state["name"]] = obj
+        return obj
+    
+    def __getattribute__(self, name: str) -> Any:
+        if name in ("_lazy", "_load"):
+            return object.__getattribute__(self, name)
+        return getattr(self._load(), name)
+    
+    def __repr__(self) -> str:
+        return repr(self._load())
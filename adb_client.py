@@ -1,11 +1,325 @@
 """ADB client wrapper for Android device control."""
+import asyncio
+import atexit
+import os
+import posixpath
+import queue
+import re
+import shutil
+import socket
+import stat
+import struct
 import subprocess
-from typing import List, Optional, Dict, Tuple
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, List, Optional, Dict, Tuple, Union
+
+from ._lazy import LazyObject
+
+
+# Absolute path to adb, resolved once. CPython only takes its posix_spawn
+# path for executables given with a directory, and otherwise does a PATH
+# search on every spawn.
+_ADB = shutil.which("adb") or "adb"
+
+# How commands reach adbd: "subprocess" runs the adb binary, "socket" talks
+# the host protocol to the adb server directly (no process spawn per call)
+ADB_BACKEND = os.environ.get("ADB_BACKEND", "subprocess")
+_ADB_SERVER_ADDR = ("127.0.0.1", int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037")))
+
+# Separator emitted between commands in shell_batch()
+_BATCH_SEP = "__ADBSEP__"
+_BATCH_SEP_RE = LazyObject(
+    lambda: re.compile(rf"^{_BATCH_SEP}(\d+)__$", re.M), globals(), "_BATCH_SEP_RE"
+)
+
+# "<serial>\t<state>" rows of `adb devices` (the header has no tab)
+_DEVICE_ROW_RE = LazyObject(
+    lambda: re.compile(r"^(\S+)\t(\S+)", re.M), globals(), "_DEVICE_ROW_RE"
+)
+
+
+# Long-running operations (e.g. bug reports) run here so tool calls return
+# immediately with a task id; see submit_background()/get_background_task()
+_BG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adb-bg")
+_BG_TASKS: Dict[str, Future] = {}
+
+
+def submit_background(fn: Callable[..., Any], *args, **kwargs) -> str:
+    """
+    Run a function on the background executor.
+    
+    Args:
+        fn: Function to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+    
+    Returns:
+        Task id to pass to get_background_task()
+    """
+    task_id = uuid.uuid4().hex[:12]
+    _BG_TASKS[task_id] = _BG_EXECUTOR.submit(fn, *args, **kwargs)
+    return task_id
+
+
+def get_background_task(task_id: str) -> Optional[Future]:
+    """Get the future for a background task, or None if the id is unknown."""
+    return _BG_TASKS.get(task_id)
+
+
+class PersistentShell:
+    """
+    Long-lived ``adb shell`` session that commands are streamed into.
+    
+    Spawning ``adb`` per command pays a process fork plus a fresh transport
+    handshake to adbd every time. This keeps one shell open per device and
+    delimits each command's output with a sentinel line carrying its exit code.
+    """
+    
+    def __init__(self, device_serial: Optional[str] = None):
+        """
+        Initialize the session (the shell itself is started lazily).
+        
+        Args:
+            device_serial: Specific device serial. If None, adb auto-selects.
+        """
+        self.device_serial = device_serial
+        self._marker = f"__ADBEND_{uuid.uuid4().hex}__"
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+        self._lock = threading.Lock()
+    
+    def _start(self):
+        """Launch the shell process and its stdout reader thread."""
+        cmd = [_ADB]
+        if self.device_serial:
+            cmd.extend(["-s", self.device_serial])
+        cmd.append("shell")
+        
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
+        )
+        self._lines = queue.Queue()
+        
+        # A reader thread lets run() wait on output with a timeout
+        reader = threading.Thread(
+            target=self._pump,
+            args=(self._proc.stdout, self._lines),
+            daemon=True
+        )
+        reader.start()
+    
+    @staticmethod
+    def _pump(stream, lines: queue.Queue):
+        """Forward stdout lines into the queue, then signal EOF with None."""
+        try:
+            for line in stream:
+                lines.put(line)
+        finally:
+            lines.put(None)
+    
+    def run(self, command: str, timeout: int = 30) -> Tuple[int, str]:
+        """
+        Run a command in the session.
+        
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds
+        
+        Returns:
+            Tuple of (exit_code, stdout)
+        
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+            OSError: If the session could not be started or has died
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            
+            # Subshell keeps `exit`/`cd` from leaking into the session, and
+            # </dev/null stops the command from consuming our later input
+            payload = f"( {command}\n) </dev/null; printf '\\n{self._marker}%d\\n' $?\n"
+            
+            try:
+                self._proc.stdin.write(payload)
+                self._proc.stdin.flush()
+            except OSError:
+                self._close()
+                raise
+            
+            deadline = time.monotonic() + timeout
+            buf = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                
+                if line is None:
+                    self._close()
+                    raise BrokenPipeError("adb shell session closed")
+                
+                if line.startswith(self._marker):
+                    output = "".join(buf)
+                    # Drop the newline printed ahead of the marker
+                    if output.endswith("\n"):
+                        output = output[:-1]
+                    return int(line[len(self._marker):]), output
+                
+                buf.append(line)
+    
+    def _close(self):
+        """Terminate the shell process (caller holds the lock)."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+    
+    def close(self):
+        """Terminate the shell process."""
+        with self._lock:
+            self._close()
+
+
+class _AdbServerConnection:
+    """
+    Connection to the local adb server speaking its host protocol.
+    
+    Requests are a 4-hex-digit length followed by the service name; the
+    server answers OKAY or FAIL (plus a length-prefixed message). A
+    connection is consumed by the service it ends up running, so each
+    command opens its own.
+    """
+    
+    def __init__(self, timeout: float):
+        self._sock = socket.create_connection(_ADB_SERVER_ADDR, timeout=timeout)
+    
+    def __enter__(self) -> "_AdbServerConnection":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self._sock.close()
+    
+    def request(self, service: str):
+        """Send a service request and check the server accepted it."""
+        data = service.encode()
+        self._sock.sendall(b"%04x" % len(data) + data)
+        status = self.recv_exact(4)
+        if status != b"OKAY":
+            message = self.read_string() if status == b"FAIL" else repr(status)
+            raise ConnectionError(f"adb server rejected {service.split(':')[0]}: {message}")
+    
+    def select_device(self, serial: Optional[str]):
+        """Route the following service to a device."""
+        self.request(f"host:transport:{serial}" if serial else "host:transport-any")
+    
+    def send(self, data: bytes):
+        self._sock.sendall(data)
+    
+    def recv_exact(self, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self._sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("adb server closed the connection")
+            buf += chunk
+        return bytes(buf)
+    
+    def read_string(self) -> str:
+        """Read a length-prefixed string."""
+        return self.recv_exact(int(self.recv_exact(4), 16)).decode(errors="replace")
+    
+    def read_all(self) -> bytes:
+        """Read until the server closes the stream."""
+        chunks = []
+        while True:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    
+    def read_into(self, f: BinaryIO):
+        """Copy the stream into a binary file until the server closes it."""
+        while True:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                return
+            f.write(chunk)
+
+
+# Largest DATA payload the sync protocol accepts per frame
+_SYNC_DATA_MAX = 64 * 1024
+
+# Shell protocol v2 packet ids (stdout/stderr/exit from the device, close-stdin to it)
+_SHELL_V2_STDOUT = 1
+_SHELL_V2_EXIT = 3
+_SHELL_V2_CLOSE_STDIN = 3
 
 
 class ADBClient:
     """Wrapper for ADB commands."""
     
+    # Shared clients, keyed by device serial (see get())
+    _POOL: Dict[str, "ADBClient"] = {}
+    _POOL_LOCK = threading.Lock()
+    
+    # Last `adb devices` result as (monotonic timestamp, devices), see get_devices()
+    _devices_cache: Optional[Tuple[float, List[Dict[str, str]]]] = None
+    _DEVICES_TTL = 2.0
+    
+    @classmethod
+    def get(cls, device_serial: Optional[str] = None) -> "ADBClient":
+        """
+        Get the shared client for a device, creating it on first use.
+        
+        Reusing one client per serial keeps its persistent shell session
+        alive across tool calls instead of starting a new one each time.
+        
+        Args:
+            device_serial: Specific device serial. If None, uses first available.
+        
+        Returns:
+            Cached ADBClient instance
+        """
+        key = device_serial or "__default__"
+        with cls._POOL_LOCK:
+            client = cls._POOL.get(key)
+            if client is None:
+                client = cls._POOL[key] = cls(device_serial)
+            return client
+    
+    @classmethod
+    def _shutdown_all(cls):
+        """Close every pooled client's shell sessions (registered with atexit)."""
+        with cls._POOL_LOCK:
+            clients = list(cls._POOL.values())
+            cls._POOL.clear()
+        for client in clients:
+            client.close()
+    
     def __init__(self, device_serial: Optional[str] = None):
         """
         Initialize ADB client.
@@ -14,71 +328,276 @@ class ADBClient:
             device_serial: Specific device serial. If None, uses first available.
         """
         self.device_serial = device_serial
+        
+        # argv prefix shared by every adb invocation from this client
+        self._prefix: Tuple[str, ...] = (_ADB, "-s", device_serial) if device_serial else (_ADB,)
+        
+        # Persistent shell sessions, keyed by device serial
+        self._shells: Dict[Optional[str], PersistentShell] = {}
+        self._shells_lock = threading.Lock()
     
-    def _run_adb(self, args: List[str], timeout: int = 30) -> Tuple[bool, str, str]:
+    def _run_adb(
+        self,
+        args: List[str],
+        timeout: int = 30,
+        binary: bool = False
+    ) -> Tuple[bool, Union[str, bytes], str]:
         """
         Run ADB command.
         
         Args:
             args: Command arguments
             timeout: Command timeout in seconds
+            binary: Return stdout as raw bytes, skipping text decoding
             
         Returns:
-            Tuple of (success, stdout, stderr)
+            Tuple of (success, stdout, stderr); stdout is bytes when binary
         """
-        cmd = ["adb"]
-        
-        # Add device serial if specified
-        if self.device_serial:
-            cmd.extend(["-s", self.device_serial])
-        
-        cmd.extend(args)
+        cmd = self._prefix + tuple(args)
         
+        # argv is passed straight to adb (never shell=True), so no host /bin/sh
+        # is spawned; device-side commands quote their arguments with shlex.
+        # Keep this call free of preexec_fn/cwd/env/start_new_session: with
+        # none of them set, CPython spawns via vfork/posix_spawn instead of
+        # fork(), so the cost doesn't grow with the agent's (large) RSS.
+        # close_fds stays on so adb's forked server never inherits our pipes.
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                timeout=timeout
+                text=not binary,
+                timeout=timeout,
+                close_fds=True
             )
             
             success = result.returncode == 0
-            return success, result.stdout.strip(), result.stderr.strip()
+            stdout, stderr = result.stdout, result.stderr
+            if binary:
+                # Payload bytes are returned untouched; only stderr is decoded
+                return success, stdout, stderr.decode(errors="replace").strip()
+            return success, stdout.strip(), stderr.strip()
             
         except subprocess.TimeoutExpired:
-            return False, "", f"Command timed out after {timeout}s"
+            return False, b"" if binary else "", f"Command timed out after {timeout}s"
+        except Exception as e:
+            return False, b"" if binary else "", str(e)
+    
+    async def _arun_adb(self, args: List[str], timeout: int = 30) -> Tuple[bool, str, str]:
+        """
+        Run ADB command without blocking the event loop.
+        
+        Async counterpart of _run_adb(): many invocations can be in flight
+        on one loop without a thread each.
+        
+        Args:
+            args: Command arguments
+            timeout: Command timeout in seconds
+        
+        Returns:
+            Tuple of (success, stdout, stderr)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._prefix,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
         except Exception as e:
             return False, "", str(e)
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, "", f"Command timed out after {timeout}s"
+        
+        success = proc.returncode == 0
+        return (
+            success,
+            stdout.decode(errors="replace").strip(),
+            stderr.decode(errors="replace").strip()
+        )
     
-    def get_devices(self) -> List[Dict[str, str]]:
+    def get_devices(self, force: bool = False) -> List[Dict[str, str]]:
         """
         Get list of connected devices.
         
+        Results are cached for a couple of seconds, since most tools start by
+        resolving the first available device and the topology rarely changes.
+        
+        Args:
+            force: Skip the cache and re-enumerate
+        
         Returns:
             List of device info dicts with 'serial' and 'status' keys
         """
-        success, stdout, stderr = self._run_adb(["devices"])
+        cached = ADBClient._devices_cache
+        if not force and cached is not None and time.monotonic() - cached[0] < self._DEVICES_TTL:
+            return list(cached[1])
+        
+        success, stdout, stderr = False, "", ""
+        if ADB_BACKEND == "socket":
+            try:
+                with _AdbServerConnection(timeout=5) as conn:
+                    conn.request("host:devices")
+                    success, stdout = True, conn.read_string()
+            except OSError:
+                pass
+        
+        if not success:
+            success, stdout, stderr = self._run_adb(["devices"])
         
         if not success:
+            ADBClient._devices_cache = None
             return []
         
-        devices = []
-        for line in stdout.split("\n")[1:]:  # Skip header
-            line = line.strip()
-            if line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    devices.append({
-                        "serial": parts[0],
-                        "status": parts[1]
-                    })
+        devices = [
+            {"serial": serial, "status": status}
+            for serial, status in _DEVICE_ROW_RE.findall(stdout)
+        ]
         
-        return devices
+        ADBClient._devices_cache = (time.monotonic(), devices)
+        return list(devices)
+    
+    @classmethod
+    def invalidate_devices_cache(cls):
+        """Forget the cached `adb devices` result (e.g. after a reboot)."""
+        cls._devices_cache = None
+    
+    def _socket_shell(self, command: str, serial: Optional[str], timeout: int = 30) -> Tuple[int, str]:
+        """
+        Run a command over the adb server socket using shell protocol v2.
+        
+        Raises:
+            OSError: If the server is unreachable, rejects the request or times out
+        """
+        with _AdbServerConnection(timeout) as conn:
+            conn.select_device(serial)
+            conn.request(f"shell,v2,raw:{command}")
+            # We never send input; tell the device so commands reading stdin see EOF
+            conn.send(struct.pack("<BI", _SHELL_V2_CLOSE_STDIN, 0))
+            
+            stdout = []
+            while True:
+                packet_id, size = struct.unpack("<BI", conn.recv_exact(5))
+                data = conn.recv_exact(size)
+                if packet_id == _SHELL_V2_STDOUT:
+                    stdout.append(data)
+                elif packet_id == _SHELL_V2_EXIT:
+                    code = data[0] if data else 0
+                    return code, b"".join(stdout).decode("utf-8", errors="replace")
+    
+    def _socket_exec_out(self, command: str, serial: Optional[str], timeout: int = 30) -> bytes:
+        """
+        Run a command over the adb server socket with the raw exec service.
+        
+        Raises:
+            OSError: If the server is unreachable, rejects the request or times out
+        """
+        with _AdbServerConnection(timeout) as conn:
+            conn.select_device(serial)
+            conn.request(f"exec:{command}")
+            return conn.read_all()
+    
+    def _socket_push_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        serial: Optional[str],
+        timeout: int = 300
+    ) -> List[Tuple[bool, str]]:
+        """
+        Push files over one adb sync connection (SEND/DATA/DONE per file).
+        
+        A failed SEND ends the device's sync service, so the next file
+        reopens the connection.
+        
+        Raises:
+            OSError: If the server is unreachable, rejects the request or times out
+        """
+        results = []
+        conn = None
+        try:
+            for local_path, remote_path in pairs:
+                if conn is None:
+                    conn = _AdbServerConnection(timeout)
+                    conn.select_device(serial)
+                    conn.request("sync:")
+                
+                # Like adb push: a directory target receives the file under its own name
+                if remote_path.endswith("/"):
+                    is_dir = True
+                else:
+                    path = remote_path.encode()
+                    conn.send(b"STAT" + struct.pack("<I", len(path)) + path)
+                    _, mode, _, _ = struct.unpack("<4sIII", conn.recv_exact(16))
+                    is_dir = stat.S_ISDIR(mode)
+                if is_dir:
+                    remote_path = posixpath.join(remote_path, os.path.basename(local_path))
+                
+                st = os.stat(local_path)
+                spec = f"{remote_path},{stat.S_IFREG | stat.S_IMODE(st.st_mode)}".encode()
+                conn.send(b"SEND" + struct.pack("<I", len(spec)) + spec)
+                with open(local_path, "rb") as f:
+                    while True:
+                        chunk = f.read(_SYNC_DATA_MAX)
+                        if not chunk:
+                            break
+                        conn.send(b"DATA" + struct.pack("<I", len(chunk)) + chunk)
+                conn.send(b"DONE" + struct.pack("<I", int(st.st_mtime)))
+                
+                status, size = struct.unpack("<4sI", conn.recv_exact(8))
+                if status == b"OKAY":
+                    results.append((True, ""))
+                else:
+                    message = conn.recv_exact(size).decode(errors="replace") if status == b"FAIL" else repr(status)
+                    results.append((False, message))
+                    conn.close()
+                    conn = None
+            
+            if conn is not None:
+                conn.send(b"QUIT" + struct.pack("<I", 0))
+        finally:
+            if conn is not None:
+                conn.close()
+        
+        return results
+    
+    def _shell_run(self, command: str, serial: Optional[str], timeout: int = 30) -> Tuple[int, str]:
+        """
+        Run a command on the configured backend.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+            OSError: If no shell session could be used
+        """
+        if ADB_BACKEND == "socket":
+            try:
+                return self._socket_shell(command, serial, timeout)
+            except socket.timeout:
+                raise subprocess.TimeoutExpired(command, timeout)
+            except OSError:
+                pass  # Server unreachable or no shell v2 support; use the adb binary
+        
+        return self._get_shell(serial).run(command, timeout)
+    
+    def _get_shell(self, serial: Optional[str]) -> PersistentShell:
+        """Get (or lazily create) the persistent shell for a serial."""
+        with self._shells_lock:
+            session = self._shells.get(serial)
+            if session is None:
+                session = self._shells[serial] = PersistentShell(serial)
+            return session
     
     def shell(self, command: str, device_serial: Optional[str] = None, timeout: int = 30) -> str:
         """
         Execute shell command on device.
         
+        Commands go through a persistent ``adb shell`` session per device
+        (or straight to the adb server when ADB_BACKEND=socket); if that
+        cannot be used, a one-shot ``adb shell`` is run instead.
+        
         Args:
             command: Shell command to execute
             device_serial: Target device serial (overrides instance serial)
@@ -87,11 +606,232 @@ class ADBClient:
         Returns:
             Command output as string (empty string on failure)
         """
-        # Build command with device serial
-        cmd = ["adb"]
-        
         # Use provided serial, or instance serial, or let adb auto-select
         serial = device_serial or self.device_serial
+        
+        try:
+            code, output = self._shell_run(command, serial, timeout)
+        except subprocess.TimeoutExpired:
+            return ""
+        except OSError:
+            return self._shell_oneshot(command, serial, timeout)
+        
+        return output.strip() if code == 0 else ""
+    
+    def shell_batch(
+        self,
+        commands: List[str],
+        device_serial: Optional[str] = None,
+        timeout: int = 30
+    ) -> List[Tuple[bool, str, str]]:
+        """
+        Execute several shell commands in a single round-trip.
+        
+        Commands run in order on the device; each one's output is delimited
+        by a separator line carrying its exit code.
+        
+        Args:
+            commands: Shell commands to execute
+            device_serial: Target device serial (overrides instance serial)
+            timeout: Timeout for the whole batch
+        
+        Returns:
+            List of (success, stdout, stderr) tuples, one per command
+        """
+        if not commands:
+            return []
+        
+        serial = device_serial or self.device_serial
+        payload = "".join(
+            f"( {command}\n)\nprintf '\\n{_BATCH_SEP}%d__\\n' $?\n" for command in commands
+        )
+        
+        try:
+            _, output = self._shell_run(payload, serial, timeout)
+        except subprocess.TimeoutExpired:
+            return [(False, "", f"Command timed out after {timeout}s")] * len(commands)
+        except OSError:
+            output = self._shell_oneshot(payload, serial, timeout)
+        
+        # split() yields [out0, code0, out1, code1, ..., trailing]
+        parts = _BATCH_SEP_RE.split(output)
+        results = []
+        for i in range(len(commands)):
+            if 2 * i + 1 < len(parts):
+                results.append((parts[2 * i + 1] == "0", parts[2 * i].strip(), ""))
+            else:
+                results.append((False, "", "No output (session ended early)"))
+        
+        return results
+    
+    def shell_many(self, items: List[Tuple[str, str]], timeout: int = 30) -> List[str]:
+        """
+        Execute shell commands on several devices concurrently.
+        
+        adb keeps a separate transport per device, so commands for different
+        serials run in parallel on a bounded thread pool. Each task uses the
+        pooled client for its serial; commands for the same serial are
+        serialized by that device's shell session.
+        
+        Args:
+            items: List of (device_serial, command) pairs
+            timeout: Timeout for each command
+        
+        Returns:
+            Command outputs in the same order as items (empty string on failure)
+        """
+        if not items:
+            return []
+        
+        def run(item: Tuple[str, str]) -> str:
+            serial, command = item
+            return ADBClient.get(serial).shell(command, timeout=timeout)
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            return list(executor.map(run, items))
+    
+    async def ashell(self, command: str, device_serial: Optional[str] = None, timeout: int = 30) -> str:
+        """
+        Execute shell command on device without blocking the event loop.
+        
+        Args:
+            command: Shell command to execute
+            device_serial: Target device serial (overrides instance serial)
+            timeout: Command timeout
+        
+        Returns:
+            Command output as string (empty string on failure)
+        """
+        serial = device_serial or self.device_serial
+        client = self if serial == self.device_serial else ADBClient.get(serial)
+        
+        success, stdout, _ = await client._arun_adb(["shell", command], timeout)
+        return stdout if success else ""
+    
+    def exec_out(self, command: str, device_serial: Optional[str] = None, timeout: int = 30) -> bytes:
+        """
+        Execute a command via ``adb exec-out`` and capture raw stdout.
+        
+        Unlike ``adb shell`` there is no terminal processing, so binary
+        output (screenshots, file contents) arrives byte-for-byte without
+        a round-trip through a temp file on the device.
+        
+        Args:
+            command: Shell command to execute
+            device_serial: Target device serial (overrides instance serial)
+            timeout: Command timeout
+        
+        Returns:
+            Command output as bytes (empty bytes on failure)
+        """
+        serial = device_serial or self.device_serial
+        
+        if ADB_BACKEND == "socket":
+            try:
+                return self._socket_exec_out(command, serial, timeout)
+            except socket.timeout:
+                return b""
+            except OSError:
+                pass
+        
+        client = self if serial == self.device_serial else ADBClient.get(serial)
+        success, stdout, _ = client._run_adb(["exec-out", command], timeout, binary=True)
+        return stdout if success else b""
+    
+    def push_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        device_serial: Optional[str] = None,
+        timeout: int = 300
+    ) -> List[Tuple[bool, str]]:
+        """
+        Push several local files to the device.
+        
+        With ADB_BACKEND=socket every file goes over a single sync connection
+        to the adb server, so the connect/transport handshake is paid once
+        instead of once per ``adb push`` process.
+        
+        Args:
+            pairs: (local_path, remote_path) pairs
+            device_serial: Target device serial (overrides instance serial)
+            timeout: Timeout per push (or for the whole sync connection)
+        
+        Returns:
+            (success, error message) per pair, in order
+        """
+        serial = device_serial or self.device_serial
+        
+        if ADB_BACKEND == "socket":
+            try:
+                return self._socket_push_many(pairs, serial, timeout)
+            except OSError:
+                pass  # Fall back to adb push (re-pushing is harmless)
+        
+        client = self if serial == self.device_serial else ADBClient.get(serial)
+        results = []
+        for local_path, remote_path in pairs:
+            success, stdout, stderr = client._run_adb(["push", local_path, remote_path], timeout=timeout)
+            results.append((success, "" if success else (stderr or stdout or "Failed to push file")))
+        return results
+    
+    def exec_out_to_file(
+        self,
+        command: str,
+        local_path: str,
+        device_serial: Optional[str] = None,
+        timeout: int = 30
+    ) -> Tuple[bool, str]:
+        """
+        Stream the raw stdout of an ``adb exec-out`` command into a local file.
+        
+        Like exec_out(), but the payload is written to disk as it arrives
+        instead of being buffered in memory, which suits large pulls.
+        
+        Args:
+            command: Shell command to execute
+            local_path: File to write the command's stdout to
+            device_serial: Target device serial (overrides instance serial)
+            timeout: Command timeout
+        
+        Returns:
+            Tuple of (success, error message)
+        """
+        serial = device_serial or self.device_serial
+        
+        if ADB_BACKEND == "socket":
+            try:
+                with _AdbServerConnection(timeout) as conn:
+                    conn.select_device(serial)
+                    conn.request(f"exec:{command}")
+                    with open(local_path, "wb") as f:
+                        conn.read_into(f)
+                return True, ""
+            except socket.timeout:
+                return False, f"Command timed out after {timeout}s"
+            except OSError:
+                pass
+        
+        client = self if serial == self.device_serial else ADBClient.get(serial)
+        try:
+            with open(local_path, "wb") as f:
+                result = subprocess.run(
+                    client._prefix + ("exec-out", command),
+                    stdout=f,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout,
+                    close_fds=True
+                )
+        except subprocess.TimeoutExpired:
+            return False, f"Command timed out after {timeout}s"
+        except OSError as e:
+            return False, str(e)
+        
+        return result.returncode == 0, result.stderr.decode(errors="replace").strip()
+    
+    def _shell_oneshot(self, command: str, serial: Optional[str], timeout: int = 30) -> str:
+        """Execute a shell command in its own ``adb shell`` process."""
+        # Build command with device serial
+        cmd = [_ADB]
         if serial:
             cmd.extend(["-s", serial])
         
@@ -111,3 +851,20 @@ class ADBClient:
             return ""
         except Exception as e:
             return ""
+
+    def close(self):
+        """Terminate all persistent shell sessions."""
+        with self._shells_lock:
+            sessions = list(self._shells.values())
+            self._shells.clear()
+        for session in sessions:
+            session.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+atexit.register(ADBClient._shutdown_all)
@@ -10,50 +10,13 @@ Usage:
     env -u http_proxy python android_agent.py
 """
 
-from deepagents import create_deep_agent
-from langchain_openai import ChatOpenAI
-
-# Import all Android tools
-from deepagents.android_tools import (
-    # Device Manager (5 tools)
-    list_android_devices,
-    get_device_info,
-    get_device_battery_info,
-    get_device_screen_info,
-    reboot_device,
-    # App Control (7 tools)
-    list_installed_packages,
-    get_app_info,
-    install_apk,
-    uninstall_app,
-    start_app,
-    stop_app,
-    clear_app_data,
-    # File Operations (11 tools)
-    list_files,
-    pull_file,
-    push_file,
-    delete_file,
-    create_directory,
-    file_exists,
-    read_file,
-    write_file,
-    file_stats,
-    list_app_databases,
-    pull_app_database,
-    # Diagnostics (3 tools)
-    take_screenshot,
-    get_logcat,
-    capture_bugreport,
-    # UI Automation (7 tools)
-    tap,
-    long_press,
-    swipe,
-    drag,
-    input_text,
-    press_key,
-    get_ui_hierarchy,
-)
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 # vLLM Server Configuration
 LLM_BASE_URL = "http://10.202.1.3:8000/v1"
@@ -61,8 +24,11 @@ LLM_API_KEY = "dummy-key"
 DEFAULT_MODEL = "/models/Qwen/Qwen3-Coder-30BB-A3B-Instruct"
 
 
-def create_model():
+def create_model() -> ChatOpenAI:
     """Create LLM model configured for internal vLLM server."""
+    # Imported here so loading this module doesn't pull in the LLM client stack
+    from langchain_openai import ChatOpenAI
+    
     return ChatOpenAI(
         base_url=LLM_BASE_URL,
         api_key=LLM_API_KEY,
@@ -74,52 +40,70 @@ def create_model():
     )
 
 
-# Collect all Android tools (33 total)
-ANDROID_TOOLS = [
+# Names of all Android tools (35 total), resolved lazily by get_android_tools()
+ANDROID_TOOL_NAMES = (
     # Device Manager (5)
-    list_android_devices,
-    get_device_info,
-    get_device_battery_info,
-    get_device_screen_info,
-    reboot_device,
+    'list_android_devices',
+    'get_device_info',
+    'get_device_battery_info',
+    'get_device_screen_info',
+    'reboot_device',
     # App Control (7)
-    list_installed_packages,
-    get_app_info,
-    install_apk,
-    uninstall_app,
-    start_app,
-    stop_app,
-    clear_app_data,
-    # File Operations (11)
-    list_files,
-    pull_file,
-    push_file,
-    delete_file,
-    create_directory,
-    file_exists,
-    read_file,
-    write_file,
-    file_stats,
-    list_app_databases,
-    pull_app_database,
-    # Diagnostics (3)
-    take_screenshot,
-    get_logcat,
-    capture_bugreport,
+    'list_installed_packages',
+    'get_app_info',
+    'install_apk',
+    'uninstall_app',
+    'start_app',
+    'stop_app',
+    'clear_app_data',
+    # File Operations (12)
+    'list_files',
+    'pull_file',
+    'push_file',
+    'push_files',
+    'delete_file',
+    'create_directory',
+    'file_exists',
+    'read_file',
+    'write_file',
+    'file_stats',
+    'list_app_databases',
+    'pull_app_database',
+    # Diagnostics (4)
+    'take_screenshot',
+    'get_logcat',
+    'capture_bugreport',
+    'get_task_status',
     # UI Automation (7)
-    tap,
-    long_press,
-    swipe,
-    drag,
-    input_text,
-    press_key,
-    get_ui_hierarchy,
-]
+    'tap',
+    'long_press',
+    'swipe',
+    'drag',
+    'input_text',
+    'press_key',
+    'get_ui_hierarchy',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_android_tools() -> tuple:
+    """Import the Android tool modules and return the tools, in ANDROID_TOOL_NAMES order."""
+    import deepagents.android_tools as android_tools
+    
+    return tuple(getattr(android_tools, name) for name in ANDROID_TOOL_NAMES)
+
+
+def __getattr__(name):
+    # Keep `from android_agent import ANDROID_TOOLS` working without importing
+    # the tool modules when this module is loaded
+    if name == "ANDROID_TOOLS":
+        return get_android_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # System prompt for Android control
 ANDROID_SYSTEM_PROMPT = """You are an Android device control assistant with access to connected Android devices via ADB.
 
-## Your Capabilities (33 Tools)
+## Your Capabilities (35 Tools)
 
 ### Device Management (5 tools)
 - List connected devices and their status
@@ -137,10 +121,10 @@ ANDROID_SYSTEM_PROMPT = """You are an Android device control assistant with acce
 - Force stop apps
 - Clear app data and cache
 
-### File Operations (11 tools)
+### File Operations (12 tools)
 - List files and directories on device
 - Pull files from device to Mac (downloads to ~/Downloads)
-- Push files from Mac to device
+- Push files from Mac to device (several at once with push_files)
 - Delete files/directories
 - Create directories
 - Check if files exist
@@ -149,10 +133,10 @@ ANDROID_SYSTEM_PROMPT = """You are an Android device control assistant with acce
 - Get file statistics
 - List and extract app databases
 
-### Diagnostics (3 tools)
+### Diagnostics (4 tools)
 - Take screenshots (saves to ~/Downloads)
 - Get system logs (logcat) with filtering
-- Capture full bug reports
+- Capture full bug reports (runs in the background; poll with get_task_status)
 
 ### UI Automation (7 tools)
 - Tap on screen coordinates
@@ -196,13 +180,16 @@ When performing actions, confirm what was done and which device was used.
 """
 
 
+@functools.lru_cache(maxsize=1)
 def create_android_agent():
-    """Create a DeepAgent with Android control capabilities."""
+    """Create a DeepAgent with Android control capabilities (built once, then reused)."""
+    from deepagents import create_deep_agent
+    
     model = create_model()
     
     agent = create_deep_agent(
         model=model,
-        tools=ANDROID_TOOLS,
+        tools=get_android_tools(),
         system_prompt=ANDROID_SYSTEM_PROMPT,
     )
     
@@ -216,7 +203,7 @@ def run_interactive():
     print("=" * 60)
     print(f"Model: {DEFAULT_MODEL}")
     print(f"Server: {LLM_BASE_URL}")
-    print(f"Tools: {len(ANDROID_TOOLS)} Android control tools")
+    print(f"Tools: {len(ANDROID_TOOL_NAMES)} Android control tools")
     print("=" * 60)
     print("\nType 'quit' or 'exit' to stop.\n")
     
@@ -3,22 +3,303 @@ App Control - Android Application Management Tools
 Provides LangChain tools for installing, uninstalling, and managing Android apps.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from langchain_core.tools import tool
 from .adb_client import ADBClient
-import json
+from ._jsonutil import dumps as _dumps
+from ._lazy import LazyObject
+import asyncio
 import os
+import re
+import threading
+import time
+from shlex import quote as _q
+
+
+# `pm list packages` command per list_installed_packages filter_type
+_FILTER_MAP = {
+    "all": "pm list packages",
+    "system": "pm list packages -s",
+    "3rdparty": "pm list packages -3",
+    "enabled": "pm list packages -e",
+    "disabled": "pm list packages -d",
+}
+_FILTER_KEYS = list(_FILTER_MAP)
+
+# APKs larger than this are pushed and installed with `pm install` (see install_apk)
+_MANUAL_INSTALL_MIN_BYTES = 50 * 1024 * 1024
+_DEVICE_TMP_APK = "/data/local/tmp/_install.apk"
+
+# Local file header signature every APK (ZIP archive) starts with
+_ZIP_MAGIC = b"PK\x03\x04"
+
+# Printed by AppController.run_if_installed() when the package is missing
+_NOT_INSTALLED = "__NOT_INSTALLED__"
+# Printed by AppController.run_if_installed() after the command has run
+_RAN_OK = "__OK__"
+
+# Fixed error responses, encoded once at import
+_ERR_NO_DEVICES = _dumps({"success": False, "error": "No devices connected"})
+_ERR_NO_DEVICES_STATUS = _dumps({"status": "error", "message": "No devices connected"})
+_ERR_NOT_APK = _dumps({"success": False, "error": "File must be an APK (.apk extension)"})
+
+# Package names in `pm list packages` output ("package:com.example.app")
+_PACKAGE_RE = LazyObject(lambda: re.compile(r"^package:(\S+)", re.M), globals(), "_PACKAGE_RE")
+
+# `dumpsys package` fields: versions are single tokens, the rest run to end of line
+_PKG_INFO_RE = LazyObject(
+    lambda: re.compile(
+        r"\b(versionName|versionCode)=(\S+)"
+        r"|\b(firstInstallTime|lastUpdateTime|installerPackageName)=(.*?)\s*$",
+        re.M
+    ),
+    globals(),
+    "_PKG_INFO_RE"
+)
+# Device-side grep for the lines _PKG_INFO_RE parses (plus the not-found message)
+_PKG_INFO_GREP = "versionName=|versionCode=|firstInstallTime=|lastUpdateTime=|installerPackageName=|Unable to find package"
+_PKG_INFO_KEYS = {
+    'versionName': 'version_name',
+    'versionCode': 'version_code',
+    'firstInstallTime': 'first_install_time',
+    'lastUpdateTime': 'last_update_time',
+    'installerPackageName': 'installer',
+}
 
 
 class AppController:
     """Manager for Android application operations via ADB."""
     
     def __init__(self):
-        self.adb = ADBClient()
+        self.adb = ADBClient.get()
+    
+    def run_if_installed(
+        self,
+        package_name: str,
+        command: str,
+        device_serial: Optional[str] = None,
+        timeout: int = 30
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Run a command only if a package is installed, in a single round-trip.
+        
+        Both branches end with a marker line, so a failed adb call (which
+        yields '') is not mistaken for a command that printed nothing.
+        
+        Args:
+            package_name: Package that must be installed
+            command: Shell command to run when it is
+            device_serial: Target device serial
+            timeout: Command timeout in seconds
+        
+        Returns:
+            (installed, output): output is the command's stdout and stderr, or
+            None if the adb call itself failed
+        """
+        pkg = _q(package_name)
+        output = self.adb.shell(
+            f"if pm path {pkg} >/dev/null 2>&1; then {command} 2>&1; echo {_RAN_OK}; "
+            f"else echo {_NOT_INSTALLED}; fi; true",
+            device_serial,
+            timeout
+        )
+        if output == _NOT_INSTALLED:
+            return False, ""
+        if output.endswith(_RAN_OK):
+            return True, output[:-len(_RAN_OK)].strip()
+        return True, None
+    
+    def run_checking_installed(
+        self,
+        package_name: str,
+        command: str,
+        success_marker: str,
+        device_serial: Optional[str] = None,
+        timeout: int = 30
+    ) -> Optional[str]:
+        """
+        Run a package command, checking the package exists only if it fails.
+        
+        Unlike run_if_installed(), the happy path runs just the command (each
+        `pm` invocation costs a JVM start on the device). If its output lacks
+        success_marker, `pm path` runs in the same round-trip so a missing
+        package can be reported as such.
+        
+        Args:
+            package_name: Package the command acts on
+            command: Shell command to run
+            success_marker: Text present in the output when the command worked
+            device_serial: Target device serial
+            timeout: Command timeout in seconds
+        
+        Returns:
+            Command output (stdout and stderr), or None if it failed because
+            the package is not installed
+        """
+        pkg = _q(package_name)
+        output = self.adb.shell(
+            f"out=$({command} 2>&1); echo \"$out\"; "
+            f"case \"$out\" in *{_q(success_marker)}*) ;; "
+            f"*) pm path {pkg} >/dev/null 2>&1 || echo {_NOT_INSTALLED};; esac; true",
+            device_serial,
+            timeout
+        )
+        if output.endswith(_NOT_INSTALLED):
+            return None
+        return output
+    
+    @staticmethod
+    def _app_info_command(package_name: str) -> str:
+        """dumpsys package, filtered on the device so only the fields we parse cross adb."""
+        return f"dumpsys package {_q(package_name)} | grep -E {_q(_PKG_INFO_GREP)}"
+    
+    @staticmethod
+    def _parse_app_info(package_name: str, output: str) -> Optional[Dict[str, Any]]:
+        """Parse filtered dumpsys output; None if the package is not installed."""
+        if not output or "Unable to find package" in output:
+            return None
+        
+        app_info = {"package_name": package_name}
+        for m in _PKG_INFO_RE.finditer(output):
+            field, value = m.group(1, 2) if m.group(1) else m.group(3, 4)
+            app_info[_PKG_INFO_KEYS[field]] = value
+        return app_info
+    
+    def get_app_info(self, package_name: str, device_serial: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get version/install details for an installed package.
+        
+        Args:
+            package_name: Package name (e.g., "com.android.chrome")
+            device_serial: Target device serial
+        
+        Returns:
+            Dict of app info, or None if the package is not installed
+        """
+        output = self.adb.shell(self._app_info_command(package_name), device_serial)
+        return self._parse_app_info(package_name, output)
+    
+    def get_app_info_many(
+        self,
+        package_names: List[str],
+        device_serial: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get app info for several packages in a single adb round-trip.
+        
+        All dumpsys queries go down the device's shell session as one batch
+        rather than one call per package.
+        
+        Args:
+            package_names: Package names to look up
+            device_serial: Target device serial
+        
+        Returns:
+            Mapping of package name to app info (None for packages not installed)
+        """
+        commands = [self._app_info_command(name) for name in package_names]
+        results = self.adb.shell_batch(commands, device_serial, timeout=30 + 2 * len(commands))
+        return {
+            name: self._parse_app_info(name, stdout)
+            for name, (_, stdout, _) in zip(package_names, results)
+        }
+    
+    async def aget_app_info_many(
+        self,
+        package_names: List[str],
+        device_serial: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Async wrapper around get_app_info_many() that keeps the event loop free."""
+        return await asyncio.to_thread(self.get_app_info_many, package_names, device_serial)
+
+
+class _ResultCache:
+    """
+    Short-lived cache for read-only tool results.
+    
+    Agents often repeat the same query within a few seconds; serving it from
+    memory saves an adb round-trip. Keys start with the device serial so
+    state-changing tools can drop everything for that device.
+    """
+    
+    def __init__(self, ttl: float = 5.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+    
+    def put(self, key: tuple, value: str):
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), value)
+    
+    def invalidate(self, device_serial: str):
+        """Drop every cached result for a device."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == device_serial]:
+                del self._entries[key]
 
 
 # Initialize global app controller
 _app_controller = AppController()
+_result_cache = _ResultCache()
+
+
+# Default device from the last enumeration, trusted for _DEFAULT_SERIAL_TTL
+# seconds; see _get_device_serial()/_forget_default_serial()
+_default_serial: Optional[str] = None
+_default_serial_checked_at = 0.0
+_DEFAULT_SERIAL_TTL = 30.0
+
+
+def _get_device_serial(device_serial: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve the target device, defaulting to the first connected one.
+    
+    The default device is remembered for a while, so steady-state tool
+    calls without a serial skip enumeration entirely. A failed adb call
+    on a device should drop it via _forget_default_serial().
+    
+    Returns:
+        Device serial, or None if no device is connected
+    """
+    global _default_serial, _default_serial_checked_at
+    
+    if device_serial:
+        return device_serial
+    
+    now = time.monotonic()
+    if _default_serial and now - _default_serial_checked_at < _DEFAULT_SERIAL_TTL:
+        return _default_serial
+    
+    devices = _app_controller.adb.get_devices()
+    if not devices:
+        _default_serial = None
+        return None
+    _default_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+    _default_serial_checked_at = now
+    return _default_serial
+
+
+def _forget_default_serial(device_serial: Optional[str]):
+    """Stop trusting the remembered default device after a failed call on it."""
+    global _default_serial
+    if device_serial == _default_serial:
+        _default_serial = None
+        ADBClient.invalidate_devices_cache()
 
 
 @tool
@@ -35,53 +316,46 @@ def list_installed_packages(device_serial: Optional[str] = None, filter_type: st
     Returns:
         str: JSON string with list of installed packages
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"status": "error", "message": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
-    
-    # Build pm list command based on filter
-    filter_map = {
-        "all": "",
-        "system": "-s",
-        "3rdparty": "-3",
-        "enabled": "-e",
-        "disabled": "-d"
-    }
-    
-    if filter_type not in filter_map:
-        return json.dumps({
+        return _ERR_NO_DEVICES_STATUS
+    
+    cache_key = (device_serial, "packages", filter_type)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # pm list command for the filter
+    cmd = _FILTER_MAP.get(filter_type)
+    
+    if cmd is None:
+        return _dumps({
             "status": "error",
-            "message": f"Invalid filter_type '{filter_type}'. Valid: {list(filter_map.keys())}"
+            "message": f"Invalid filter_type '{filter_type}'. Valid: {_FILTER_KEYS}"
         })
     
-    filter_flag = filter_map[filter_type]
-    cmd = f"pm list packages {filter_flag}".strip()
-    
     output = _app_controller.adb.shell(cmd, device_serial)
     
     if not output:
-        return json.dumps({
+        # `pm list packages` always prints something; the device is likely gone
+        _forget_default_serial(device_serial)
+        return _dumps({
             "status": "error",
             "message": "Failed to list packages"
         })
     
     # Parse package names (format: "package:com.example.app")
-    packages = []
-    for line in output.split('\n'):
-        if line.startswith('package:'):
-            package_name = line.replace('package:', '').strip()
-            if package_name:
-                packages.append(package_name)
-    
-    return json.dumps({
+    packages = _PACKAGE_RE.findall(output)
+    
+    result = _dumps({
         "status": "success",
         "serial": device_serial,
         "filter": filter_type,
         "count": len(packages),
         "packages": packages
-    }, indent=2)
+    })
+    _result_cache.put(cache_key, result)
+    return result
 
 
 @tool
@@ -98,88 +372,112 @@ def get_app_info(package_name: str, device_serial: Optional[str] = None) -> str:
     Returns:
         str: JSON string with application information
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"status": "error", "message": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES_STATUS
+    
+    cache_key = (device_serial, "app_info", package_name)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
     # Get package info using dumpsys
-    output = _app_controller.adb.shell(f"dumpsys package {package_name}", device_serial)
+    app_info = _app_controller.get_app_info(package_name, device_serial)
     
-    if not output or "Unable to find package" in output:
-        return json.dumps({
+    if app_info is None:
+        return _dumps({
             "status": "error",
             "message": f"Package '{package_name}' not found on device"
         })
     
-    # Parse key information
-    app_info = {"package_name": package_name}
-    
-    for line in output.split('\n'):
-        line = line.strip()
-        
-        if 'versionName=' in line:
-            app_info['version_name'] = line.split('versionName=')[1].split()[0]
-        elif 'versionCode=' in line:
-            app_info['version_code'] = line.split('versionCode=')[1].split()[0]
-        elif 'firstInstallTime=' in line:
-            app_info['first_install_time'] = line.split('firstInstallTime=')[1].strip()
-        elif 'lastUpdateTime=' in line:
-            app_info['last_update_time'] = line.split('lastUpdateTime=')[1].strip()
-        elif 'installerPackageName=' in line:
-            app_info['installer'] = line.split('installerPackageName=')[1].strip()
-    
-    return json.dumps({
+    result = _dumps({
         "status": "success",
         "serial": device_serial,
         "app_info": app_info
-    }, indent=2)
+    })
+    _result_cache.put(cache_key, result)
+    return result
+
+
+def _install_via_push(adb: ADBClient, apk_path: str) -> tuple:
+    """
+    Install by pushing the APK to /data/local/tmp and running `pm install`.
+    
+    Returns:
+        Tuple of (success, output, error) like ADBClient._run_adb()
+    """
+    success, stdout, stderr = adb._run_adb(["push", apk_path, _DEVICE_TMP_APK], timeout=600)
+    if not success:
+        return False, stdout, stderr or "Failed to push APK to device"
+    
+    # Install and clean up in one round-trip
+    output = adb.shell(f"pm install -r {_DEVICE_TMP_APK} 2>&1; rm -f {_DEVICE_TMP_APK}", timeout=300)
+    return "Success" in output, output, ""
 
 
 @tool
-def install_apk(apk_path: str, device_serial: Optional[str] = None) -> str:
+def install_apk(apk_path: str, device_serial: Optional[str] = None, prefer_manual: bool = False) -> str:
     """Install an APK file on an Android device.
     
+    Large APKs (over 50 MB) are pushed to the device and installed with
+    `pm install`, which is more reliable than `adb install` for big files.
+    
     Args:
         apk_path: Path to the APK file on local machine
         device_serial: Device serial number (optional, uses first device if not specified)
+        prefer_manual: Use the push + `pm install` flow regardless of size
     
     Returns:
         JSON string with installation result
     """
-    # Validate APK exists
-    if not os.path.exists(apk_path):
-        return json.dumps({
+    # Validate APK exists (one stat, reused below for the size check)
+    try:
+        apk_size = os.stat(apk_path).st_size
+    except OSError:
+        return _dumps({
             "success": False,
             "error": f"APK file not found: {apk_path}"
         })
     
     if not apk_path.endswith('.apk'):
-        return json.dumps({
+        return _ERR_NOT_APK
+    
+    # APKs are ZIP archives; catch non-APKs here rather than after a device round-trip
+    try:
+        with open(apk_path, 'rb') as f:
+            magic = f.read(4)
+    except OSError as e:
+        return _dumps({"success": False, "error": f"Cannot read APK: {e}"})
+    
+    if magic != _ZIP_MAGIC:
+        return _dumps({
             "success": False,
-            "error": "File must be an APK (.apk extension)"
+            "error": f"Not a valid APK (missing ZIP header): {apk_path}"
         })
     
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"success": False, "error": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES
+    
+    adb = ADBClient.get(device_serial)
+    if prefer_manual or apk_size > _MANUAL_INSTALL_MIN_BYTES:
+        success, stdout, stderr = _install_via_push(adb, apk_path)
+    else:
+        # Install APK using adb install command
+        success, stdout, stderr = adb._run_adb(["install", "-r", apk_path], timeout=120)
     
-    # Install APK using adb install command
-    adb = ADBClient(device_serial)
-    success, stdout, stderr = adb._run_adb(["install", "-r", apk_path], timeout=120)
+    # Installed packages/app info may have changed
+    _result_cache.invalidate(device_serial)
     
     if success and "Success" in stdout:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Successfully installed {os.path.basename(apk_path)}",
             "device": device_serial
         })
     else:
         error_msg = stderr or stdout or "Unknown installation error"
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": error_msg,
             "device": device_serial
@@ -197,34 +495,35 @@ def uninstall_app(package_name: str, device_serial: Optional[str] = None) -> str
     Returns:
         JSON string with uninstallation result
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"success": False, "error": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES
     
-    # Check if package exists first
-    output = _app_controller.adb.shell(f"pm list packages {package_name}", device_serial)
+    # Uninstall; existence is only checked (same round-trip) if it fails
+    output = _app_controller.run_checking_installed(
+        package_name, f"pm uninstall {_q(package_name)}", "Success", device_serial, timeout=60
+    )
     
-    if not output or package_name not in output:
-        return json.dumps({
+    if output is None:
+        return _dumps({
             "success": False,
             "error": f"Package not found: {package_name}"
         })
     
-    # Uninstall the package
-    adb = ADBClient(device_serial)
-    success, stdout, stderr = adb._run_adb(["uninstall", package_name], timeout=60)
+    # Installed packages/app info may have changed
+    _result_cache.invalidate(device_serial)
     
-    if success and "Success" in stdout:
-        return json.dumps({
+    if output and "Success" in output:
+        return _dumps({
             "success": True,
             "message": f"Successfully uninstalled {package_name}",
             "device": device_serial
         })
     else:
-        error_msg = stderr or stdout or "Unknown uninstallation error"
-        return json.dumps({
+        if not output:
+            _forget_default_serial(device_serial)
+        error_msg = output or "Unknown uninstallation error"
+        return _dumps({
             "success": False,
             "error": error_msg,
             "device": device_serial
@@ -242,35 +541,34 @@ def start_app(package_name: str, device_serial: Optional[str] = None) -> str:
     Returns:
         JSON string with launch result
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"success": False, "error": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES
     
     # Use monkey tool to launch app (works without knowing activity name)
-    output = _app_controller.adb.shell(
-        f"monkey -p {package_name} -c android.intent.category.LAUNCHER 1",
+    output = _app_controller.run_checking_installed(
+        package_name,
+        f"monkey -p {_q(package_name)} -c android.intent.category.LAUNCHER 1",
+        "Events injected: 1",
         device_serial
     )
     
-    if output and "Events injected: 1" in output:
-        return json.dumps({
+    if output is None:
+        return _dumps({
+            "success": False,
+            "error": f"Package not found: {package_name}"
+        })
+    
+    if "Events injected: 1" in output:
+        return _dumps({
             "success": True,
             "message": f"Successfully launched {package_name}",
             "device": device_serial
         })
     else:
-        # Check if package exists
-        check_output = _app_controller.adb.shell(f"pm list packages {package_name}", device_serial)
-        
-        if not check_output or package_name not in check_output:
-            return json.dumps({
-                "success": False,
-                "error": f"Package not found: {package_name}"
-            })
-        
-        return json.dumps({
+        if not output:
+            _forget_default_serial(device_serial)
+        return _dumps({
             "success": False,
             "error": output or "Failed to launch app",
             "device": device_serial
@@ -288,25 +586,32 @@ def stop_app(package_name: str, device_serial: Optional[str] = None) -> str:
     Returns:
         JSON string with stop result
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"success": False, "error": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES
     
-    # Check if package exists first
-    output = _app_controller.adb.shell(f"pm list packages {package_name}", device_serial)
+    # am force-stop succeeds silently for unknown packages, so check first
+    # (in the same round-trip)
+    installed, output = _app_controller.run_if_installed(
+        package_name, f"am force-stop {_q(package_name)}", device_serial
+    )
     
-    if not output or package_name not in output:
-        return json.dumps({
+    if not installed:
+        return _dumps({
             "success": False,
             "error": f"Package not found: {package_name}"
         })
     
-    # Force stop the app
-    _app_controller.adb.shell(f"am force-stop {package_name}", device_serial)
+    if output is None:
+        # Neither marker came back: the adb call failed, the device is likely gone
+        _forget_default_serial(device_serial)
+        return _dumps({
+            "success": False,
+            "error": f"Failed to stop {package_name}",
+            "device": device_serial
+        })
     
-    return json.dumps({
+    return _dumps({
         "success": True,
         "message": f"Successfully stopped {package_name}",
         "device": device_serial
@@ -324,32 +629,34 @@ def clear_app_data(package_name: str, device_serial: Optional[str] = None) -> st
     Returns:
         JSON string with clear result
     """
+    device_serial = _get_device_serial(device_serial)
     if not device_serial:
-        devices = _app_controller.adb.get_devices()
-        if not devices:
-            return json.dumps({"success": False, "error": "No devices connected"})
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        return _ERR_NO_DEVICES
     
-    # Check if package exists first
-    output = _app_controller.adb.shell(f"pm list packages {package_name}", device_serial)
+    # Clear app data; existence is only checked (same round-trip) if it fails
+    output = _app_controller.run_checking_installed(
+        package_name, f"pm clear {_q(package_name)}", "Success", device_serial
+    )
     
-    if not output or package_name not in output:
-        return json.dumps({
+    if output is None:
+        return _dumps({
             "success": False,
             "error": f"Package not found: {package_name}"
         })
     
-    # Clear app data
-    output = _app_controller.adb.shell(f"pm clear {package_name}", device_serial)
+    # Installed packages/app info may have changed
+    _result_cache.invalidate(device_serial)
     
-    if output and "Success" in output:
-        return json.dumps({
+    if "Success" in output:
+        return _dumps({
             "success": True,
             "message": f"Successfully cleared data for {package_name}",
             "device": device_serial
         })
     else:
-        return json.dumps({
+        if not output:
+            _forget_default_serial(device_serial)
+        return _dumps({
             "success": False,
             "error": output or "Failed to clear app data",
             "device": device_serial
@@ -361,4 +668,9 @@ __all__ = [
     'AppController',
     'list_installed_packages',
     'get_app_info',
+    'install_apk',
+    'uninstall_app',
+    'start_app',
+    'stop_app',
+    'clear_app_data',
 ]
@@ -13,18 +13,122 @@ DUAL URL SUPPORT:
 """
 
 import os
+import re
+import asyncio
 import base64
 import json
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from html import escape
 
+import requests
 from atlassian import Confluence
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import httpx
 
 
-@dataclass
+# CDATA sections in storage format (e.g. code macro bodies)
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.S)
+
+# /rest/api/search expansions (relative to each result, hence "content.")
+_SEARCH_EXPAND = "content.space,content.version"
+
+# Read size for streamed image downloads
+_IMAGE_CHUNK_SIZE = 64 * 1024
+
+
+class _Base64Stream:
+    """
+    Incremental base64 encoder for streamed downloads.
+    
+    Encodes each chunk as it arrives (carrying over the bytes that don't fill
+    a 3-byte group), so the raw image is never held in memory as a whole.
+    """
+    
+    def __init__(self):
+        self._parts: List[str] = []
+        self._pending = b""
+    
+    def feed(self, chunk: bytes):
+        """Encode a chunk, keeping any trailing partial 3-byte group."""
+        data = self._pending + chunk if self._pending else chunk
+        cut = len(data) - len(data) % 3
+        if cut:
+            self._parts.append(base64.b64encode(data[:cut]).decode("ascii"))
+        self._pending = data[cut:]
+    
+    def finish(self) -> str:
+        """Encode the remainder and return the full base64 string."""
+        if self._pending:
+            self._parts.append(base64.b64encode(self._pending).decode("ascii"))
+            self._pending = b""
+        return "".join(self._parts)
+
+
+def _cql_escape(value: str) -> str:
+    """Escape a value for use inside a double-quoted CQL string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class _QueryCache:
+    """
+    Small TTL + LRU cache for read-only API responses (search, space list).
+    
+    Interactive use repeats the same queries a lot; a hit skips the server
+    round-trip. Write operations clear it (see ConfluenceClient.invalidate_cache).
+    """
+    
+    def __init__(self, ttl: float = 60.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+            # Re-insert to mark as most recently used
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: tuple, value: Any):
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                # Evict the least recently used entry (dicts keep insertion order)
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), value)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl
+            }
+
+
+@dataclass(slots=True)
 class PageContent:
     """Structured page content."""
     page_id: str
@@ -40,7 +144,7 @@ class PageContent:
     has_images: bool
 
 
-@dataclass 
+@dataclass(slots=True)
 class SearchResult:
     """Search result item."""
     page_id: str
@@ -92,12 +196,66 @@ class ConfluenceClient:
         # Browser URL for clickable links (falls back to base_url if not set)
         self.browser_url = os.getenv("CONFLUENCE_BROWSER_URL", self.base_url).rstrip("/")
         
+        # Pooled session that retries rate limiting / transient server errors
+        # with exponential backoff (honouring Retry-After)
+        self._session = requests.Session()
+        self._session.mount(self.base_url, HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        ))
+        
         self.client = Confluence(
             url=self.base_url,
             username=self.username,
             password=self.password,
-            verify_ssl=False  # For self-signed certs
+            verify_ssl=False,  # For self-signed certs
+            session=self._session
+        )
+        
+        # Long-lived HTTP client for direct REST calls and image downloads;
+        # keeps pooled keep-alive connections instead of re-handshaking per request
+        self._http = httpx.Client(
+            verify=False,
+            auth=(self.username, self.password),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(30.0)
         )
+        
+        # Recent search / space list responses
+        self._query_cache = _QueryCache()
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._http.close()
+        self._session.close()
+    
+    def invalidate_cache(self):
+        """Drop cached search and space list responses."""
+        self._query_cache.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the query cache."""
+        return self._query_cache.stats()
+    
+    def _cached_query(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the cached response for key, calling fetch() on a miss."""
+        result = self._query_cache.get(key)
+        if result is None:
+            result = fetch()
+            self._query_cache.put(key, result)
+        return result
+    
+    def __enter__(self) -> "ConfluenceClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     # =========================================================================
     # URL HELPERS (Confluence Server/Data Center format)
@@ -149,27 +307,41 @@ class ConfluenceClient:
         if space_key:
             cql = f'space = "{space_key}" AND {cql}'
         
-        results = self.client.cql(cql, limit=limit, start=start)
+        # Expand space and version so every field comes from this one call.
+        # Don't fetch pages individually to fill in metadata: one request
+        # must serve the whole result page.
+        results = self._cached_query(
+            ("cql", cql, limit, start),
+            lambda: self.client.cql(cql, limit=limit, start=start, expand=_SEARCH_EXPAND)
+        )
         
+        # Results are built as plain dicts with SearchResult's fields; the
+        # return value is serialized anyway, so no dataclass round-trip
         items = []
         for item in results.get("results", []):
             content = item.get("content", item)
             page_id = content.get("id", "")
+            space = content.get("space")
+            if not isinstance(space, dict):
+                space = {}
+            version = content.get("version")
+            if not isinstance(version, dict):
+                version = {}
             
-            items.append(SearchResult(
-                page_id=page_id,
-                title=content.get("title", ""),
-                space_key=content.get("space", {}).get("key", "") if isinstance(content.get("space"), dict) else "",
-                space_name=content.get("space", {}).get("name", "") if isinstance(content.get("space"), dict) else "",
-                url=self._build_page_url(page_id),
-                excerpt=item.get("excerpt", ""),
-                last_modified=content.get("version", {}).get("when", "") if isinstance(content.get("version"), dict) else ""
-            ))
+            items.append({
+                "page_id": page_id,
+                "title": content.get("title", ""),
+                "space_key": space.get("key", ""),
+                "space_name": space.get("name", ""),
+                "url": self._build_page_url(page_id),
+                "excerpt": item.get("excerpt", ""),
+                "last_modified": version.get("when", "")
+            })
         
         total = results.get("totalSize", len(items))
         
         return {
-            "results": [vars(item) for item in items],
+            "results": items,
             "total": total,
             "start": start,
             "limit": limit,
@@ -183,7 +355,7 @@ class ConfluenceClient:
         Returns:
             List of spaces with key, name, and type
         """
-        spaces = self.client.get_all_spaces(limit=limit)
+        spaces = self._cached_query(("spaces", limit), lambda: self.client.get_all_spaces(limit=limit))
         
         return [
             {
@@ -218,22 +390,66 @@ class ConfluenceClient:
         Returns:
             PageContent with full page details
         """
+        return self._parse_page(self._fetch_page_raw(page_id, space_key, title, expand))[0]
+    
+    def _fetch_page_raw(
+        self,
+        page_id: Optional[str] = None,
+        space_key: Optional[str] = None,
+        title: Optional[str] = None,
+        expand: str = "body.storage,version,space"
+    ) -> Dict[str, Any]:
+        """
+        Fetch the raw page dict from the API by ID or by space+title.
+        
+        Raises:
+            ValueError: If the arguments are incomplete or the page doesn't exist
+        """
         if page_id:
             page = self.client.get_page_by_id(page_id, expand=expand)
         elif space_key and title:
-            page = self.client.get_page_by_title(space_key, title, expand=expand)
+            page = self._find_page_by_title(space_key, title, expand)
         else:
             raise ValueError("Must provide page_id OR (space_key AND title)")
         
         if not page:
             raise ValueError(f"Page not found: {page_id or f'{space_key}/{title}'}")
         
+        return page
+    
+    def _find_page_by_title(self, space_key: str, title: str, expand: str) -> Optional[Dict[str, Any]]:
+        """
+        Look a page up by space + title through the CQL content search.
+        
+        get_page_by_title() goes through the /content listing, which is slow
+        on large Server/DC instances; /content/search uses the search index.
+        Falls back to get_page_by_title() when the index has no match (e.g.
+        a page created moments ago and not indexed yet).
+        """
+        cql = f'type = page AND space = "{_cql_escape(space_key)}" AND title = "{_cql_escape(title)}"'
+        results = self.client.get(
+            "rest/api/content/search",
+            params={"cql": cql, "limit": 1, "expand": expand}
+        )
+        pages = (results or {}).get("results", [])
+        if pages:
+            return pages[0]
+        return self.client.get_page_by_title(space_key, title, expand=expand)
+    
+    def _parse_page(self, page: Dict[str, Any]) -> Tuple[PageContent, BeautifulSoup]:
+        """
+        Build PageContent from a raw page dict, parsing its body only once.
+        
+        Returns:
+            (PageContent, parsed body soup)
+        """
         retrieved_page_id = page.get("id", "")
-        body_html = page.get("body", {}).get("storage", {}).get("value", "")
-        body_text = self._html_to_text(body_html)
-        image_urls = self._extract_image_urls(body_html, retrieved_page_id)
+        body_html = self._storage_body(page)
+        soup = self._parse_html(body_html)
+        body_text = self._soup_to_text(soup)
+        image_urls = self._soup_image_urls(soup, retrieved_page_id)
         
-        return PageContent(
+        page_content = PageContent(
             page_id=retrieved_page_id,
             title=page.get("title", ""),
             space_key=page.get("space", {}).get("key", ""),
@@ -246,6 +462,7 @@ class ConfluenceClient:
             image_urls=image_urls,
             has_images=len(image_urls) > 0
         )
+        return page_content, soup
     
     def get_page_text_only(
         self,
@@ -260,8 +477,24 @@ class ConfluenceClient:
         Returns:
             Plain text content
         """
-        page = self.get_page(page_id, space_key, title)
-        return page.body_text
+        # Only the body is needed: skip version/space expansion, PageContent and image extraction
+        page = self._fetch_page_raw(page_id, space_key, title, expand="body.storage")
+        return self._html_to_text(self._storage_body(page))
+    
+    async def aget_page_text_only(
+        self,
+        page_id: Optional[str] = None,
+        space_key: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of get_page_text_only() for callers on an event loop.
+        
+        Returns:
+            Plain text content
+        """
+        page = await asyncio.to_thread(self._fetch_page_raw, page_id, space_key, title, "body.storage")
+        return await self._ahtml_to_text(self._storage_body(page))
     
     def get_child_pages(
         self,
@@ -310,6 +543,7 @@ class ConfluenceClient:
             body=body,
             parent_id=parent_id
         )
+        self.invalidate_cache()
         
         created_page_id = result.get("id", "")
         
@@ -342,6 +576,7 @@ class ConfluenceClient:
             title=title,
             body=body
         )
+        self.invalidate_cache()
         
         updated_page_id = result.get("id", "")
         
@@ -365,8 +600,7 @@ class ConfluenceClient:
             List of tables, each table is a list of rows,
             each row is a list of cell values.
         """
-        page = self.get_page(page_id)
-        soup = BeautifulSoup(page.body_html, "html.parser")
+        _, soup = self._fetch_page_soup(page_id)
         
         tables = []
         for table in soup.find_all("table"):
@@ -403,8 +637,7 @@ class ConfluenceClient:
         Returns:
             Dict with success status and updated page info
         """
-        page = self.get_page(page_id)
-        soup = BeautifulSoup(page.body_html, "html.parser")
+        page, soup = self._fetch_page_soup(page_id, round_trip=True)
         
         tables = soup.find_all("table")
         if table_index >= len(tables):
@@ -421,7 +654,7 @@ class ConfluenceClient:
         
         cells[col_index].string = new_value
         
-        return self.update_page(page_id, page.title, str(soup))
+        return self.update_page(page_id, page.get("title", ""), str(soup))
     
     # =========================================================================
     # IMAGE OPERATIONS (for VLM)
@@ -435,80 +668,164 @@ class ConfluenceClient:
         Returns:
             List of dicts with 'url', 'base64', 'media_type'
         """
-        page = self.get_page(page_id)
-        images = []
+        page = self._fetch_page_raw(page_id, expand="body.storage")
+        coro = self._aget_images(self._extract_image_urls(self._storage_body(page), page.get("id", page_id)))
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        
+        # Called from inside an event loop: asyncio.run() can't nest, so give
+        # the downloads their own loop on a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def aget_page_images_base64(self, page_id: str) -> List[Dict[str, str]]:
+        """
+        Async variant of get_page_images_base64() for callers on an event loop.
+        
+        Returns:
+            List of dicts with 'url', 'base64', 'media_type'
+        """
+        page = await asyncio.to_thread(self._fetch_page_raw, page_id, expand="body.storage")
+        urls = await self._aextract_image_urls(self._storage_body(page), page.get("id", page_id))
+        return await self._aget_images(urls)
+    
+    async def _aget_images(self, urls: List[str]) -> List[Dict[str, str]]:
+        """Download all images concurrently, keeping the order of urls."""
+        if not urls:
+            return []
+        
+        async with httpx.AsyncClient(
+            verify=False,
+            auth=(self.username, self.password),
+            limits=httpx.Limits(max_connections=32),
+            timeout=httpx.Timeout(30.0)
+        ) as client:
+            results = await asyncio.gather(
+                *(self._adownload_image(client, img_url) for img_url in urls),
+                return_exceptions=True
+            )
         
-        for img_url in page.image_urls:
-            try:
-                img_data = self._download_image_base64(img_url)
-                if img_data:
-                    images.append(img_data)
-            except Exception as e:
+        images = []
+        for img_url, result in zip(urls, results):
+            if isinstance(result, Exception):
                 # Skip failed images
                 images.append({
                     "url": img_url,
-                    "error": str(e),
+                    "error": str(result),
                     "base64": None,
                     "media_type": None
                 })
+            elif result:
+                images.append(result)
         
         return images
     
-    def _download_image_base64(self, img_url: str) -> Dict[str, str]:
-        """Download an image and return as base64."""
+    async def _adownload_image(self, client: httpx.AsyncClient, img_url: str) -> Dict[str, str]:
+        """Download an image with an async client and return as base64."""
+        async with client.stream("GET", self._image_full_url(img_url)) as response:
+            response.raise_for_status()
+            encoder = _Base64Stream()
+            async for chunk in response.aiter_bytes(_IMAGE_CHUNK_SIZE):
+                encoder.feed(chunk)
+            return self._image_result(img_url, response, encoder.finish())
+    
+    def _image_full_url(self, img_url: str) -> str:
+        """Resolve an image URL for downloading."""
         # Handle relative URLs - use base_url (API) for downloading
         if img_url.startswith("/"):
-            full_url = f"{self.base_url}{img_url}"
-        else:
-            full_url = img_url
+            return f"{self.base_url}{img_url}"
+        return img_url
+    
+    def _image_result(self, img_url: str, response: httpx.Response, base64_data: str) -> Dict[str, str]:
+        """Build the image dict from a downloaded response."""
+        content_type = response.headers.get("content-type", "image/png")
         
-        with httpx.Client(verify=False, auth=(self.username, self.password)) as client:
-            response = client.get(full_url)
-            response.raise_for_status()
-            
-            content_type = response.headers.get("content-type", "image/png")
-            base64_data = base64.b64encode(response.content).decode("utf-8")
-            
-            return {
-                "url": img_url,
-                "base64": base64_data,
-                "media_type": content_type.split(";")[0]
-            }
+        return {
+            "url": img_url,
+            "base64": base64_data,
+            "media_type": content_type.split(";")[0]
+        }
     
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
     
+    def _fetch_page_soup(self, page_id: str, round_trip: bool = False) -> Tuple[Dict[str, Any], BeautifulSoup]:
+        """Fetch just a page's storage body and parse it (for table operations)."""
+        page = self._fetch_page_raw(page_id, expand="body.storage")
+        body_html = self._storage_body(page)
+        return page, self._parse_html(body_html, round_trip)
+    
+    def _parse_html(self, html: str, round_trip: bool = False) -> BeautifulSoup:
+        """
+        Parse page HTML (storage format).
+        
+        Args:
+            html: Storage-format body
+            round_trip: The soup will be serialized back to Confluence. Uses
+                html.parser, which keeps CDATA sections and adds no
+                <html><body> wrapper; otherwise the faster lxml parser is used.
+        """
+        if round_trip:
+            return BeautifulSoup(html, "html.parser")
+        
+        # lxml's HTML parser drops CDATA sections (code macro bodies), so
+        # turn them into escaped text first
+        if "<![CDATA[" in html:
+            html = _CDATA_RE.sub(lambda m: escape(m.group(1), quote=False), html)
+        return BeautifulSoup(html, "lxml")
+    
+    @staticmethod
+    def _storage_body(page: Dict[str, Any]) -> str:
+        """Storage-format body of a raw page dict."""
+        return page.get("body", {}).get("storage", {}).get("value", "")
+    
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Remove script and style elements
-        for element in soup(["script", "style"]):
-            element.decompose()
-        
+        return self._soup_to_text(self._parse_html(html))
+    
+    async def _ahtml_to_text(self, html: str) -> str:
+        """_html_to_text() on a worker thread, so parsing doesn't block the event loop."""
+        return await asyncio.to_thread(self._html_to_text, html)
+    
+    def _soup_to_text(self, soup: BeautifulSoup) -> str:
+        """Convert parsed HTML to plain text."""
+        # get_text() already skips <script>/<style> contents, so the soup is
+        # left untouched for callers that serialize it again
         return soup.get_text(separator="\n", strip=True)
     
     def _extract_image_urls(self, html: str, page_id: str) -> List[str]:
         """Extract all image URLs from HTML content."""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._soup_image_urls(self._parse_html(html), page_id)
+    
+    async def _aextract_image_urls(self, html: str, page_id: str) -> List[str]:
+        """_extract_image_urls() on a worker thread, so parsing doesn't block the event loop."""
+        return await asyncio.to_thread(self._extract_image_urls, html, page_id)
+    
+    def _soup_image_urls(self, soup: BeautifulSoup, page_id: str) -> List[str]:
+        """Extract unique image URLs from parsed HTML, in document order."""
         urls = []
-        
-        for img in soup.find_all("img"):
-            src = img.get("src", "")
-            if src:
-                urls.append(src)
-        
-        # Also check for ac:image (Confluence macro)
-        for ac_img in soup.find_all("ac:image"):
-            ri_att = ac_img.find("ri:attachment")
-            if ri_att:
-                filename = ri_att.get("ri:filename", "")
-                if filename:
-                    # Use download/attachments path for Server/DC
-                    urls.append(f"/download/attachments/{page_id}/{filename}")
-        
-        return urls
+        # Use download/attachments path for Server/DC
+        attachment_prefix = f"/download/attachments/{page_id}/"
+        
+        # One tree walk for both <img> and the ac:image Confluence macro
+        for tag in soup.find_all(["img", "ac:image"]):
+            if tag.name == "img":
+                src = tag.get("src", "")
+                if src:
+                    urls.append(src)
+            else:
+                ri_att = tag.find("ri:attachment")
+                if ri_att:
+                    filename = ri_att.get("ri:filename", "")
+                    if filename:
+                        urls.append(attachment_prefix + filename)
+        
+        # The same attachment can be referenced more than once; download it once
+        return list(dict.fromkeys(urls))
     
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -518,7 +835,9 @@ class ConfluenceClient:
             Dict with success status and server info
         """
         try:
-            spaces = self.client.get_all_spaces(limit=1)
+            response = self._http.get(f"{self.base_url}/rest/api/space", params={"limit": 1})
+            response.raise_for_status()
+            spaces = response.json()
             return {
                 "success": True,
                 "message": "Connected to Confluence successfully",
@@ -1,6 +1,7 @@
 """Debug script to check getprop output"""
 import sys
 import os
+import re
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'libs/deepagents/deepagents'))
 
 from android_tools.adb_client import ADBClient
@@ -19,14 +20,15 @@ if devices:
         'brand': 'ro.product.brand',
     }
     
+    # One `getprop` call dumps everything as "[name]: [value]" lines
+    raw = adb.shell("getprop", serial)
+    print(f"Raw output type: {type(raw)}, {len(raw)} chars\n")
+    all_props = dict(re.findall(r"^\[([^\]]+)\]:\s*\[([^\]]*)\]", raw, re.M))
+    
     for name, prop in props_to_test.items():
-        result = adb.shell(f"getprop {prop}", serial)
+        result = all_props.get(prop)
         print(f"{name} ({prop}):")
-        print(f"  Type: {type(result)}")
-        print(f"  Raw result: {repr(result)}")
-        if isinstance(result, tuple):
-            print(f"  Output: {repr(result[0])}")
-            print(f"  Error: {repr(result[1])}")
+        print(f"  Parsed value: {repr(result)}")
         print()
 else:
     print("No devices connected")
@@ -3,62 +3,154 @@ Device Manager - Android Device Discovery and Management Tools
 Provides LangChain tools for listing, selecting, and querying Android devices.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.tools import tool
 from .adb_client import ADBClient
+from ._lazy import LazyObject
 import json
+import re
+import time
+
+
+# "key: value" lines of `dumpsys battery` output (key runs to the first colon)
+_BATTERY_FIELD_RE = LazyObject(
+    lambda: re.compile(r"^[ \t]*([^:\n]*?)[ \t]*:[ \t]*([^\n]*?)[ \t\r]*$", re.M),
+    globals(),
+    "_BATTERY_FIELD_RE"
+)
+
+# One "[name]: [value]" line of `getprop` output
+_GETPROP_RE = LazyObject(lambda: re.compile(r"^\[([^\]]+)\]:\s*\[([^\]]*)\]", re.M), globals(), "_GETPROP_RE")
+
+# Basic device info: result key -> system property
+_PROP_COMMANDS = {
+    'manufacturer': 'ro.product.manufacturer',
+    'model': 'ro.product.model',
+    'brand': 'ro.product.brand',
+    'device': 'ro.product.device',
+    'android_version': 'ro.build.version.release',
+    'sdk_version': 'ro.build.version.sdk',
+    'build_id': 'ro.build.id',
+    'serial': 'ro.serialno',
+}
+
+# Status queries, each run in a single shell_batch round-trip (greps stay on the
+# device so only the relevant lines of the large dumpsys output cross USB)
+_STATUS_COMMANDS = (
+    "dumpsys battery",
+    "dumpsys power | grep 'Display Power'",
+    "dumpsys wifi | grep 'Wi-Fi is'",
+)
+_SCREEN_COMMANDS = (
+    "wm size",
+    "wm density",
+    "dumpsys power | grep 'Display Power'",
+    "dumpsys input | grep 'SurfaceOrientation'",
+)
+
+# Cache lifetimes (seconds): ro.* properties only change across a reboot/flash,
+# battery/screen/wifi status changes all the time
+_PROPS_TTL = 300.0
+_STATUS_TTL = 5.0
 
 
 class DeviceManager:
     """Manager for Android device operations via ADB."""
     
     def __init__(self):
-        self.adb = ADBClient()
+        self.adb = ADBClient.get()
+        
+        # serial -> (fetched_at, values); see _PROPS_TTL / _STATUS_TTL
+        self._props_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
+    def clear_cache(self, device_serial: Optional[str] = None):
+        """
+        Forget cached device properties and status.
+        
+        Args:
+            device_serial: Device to forget. If None, clears every device.
+        """
+        if device_serial:
+            self._props_cache.pop(device_serial, None)
+            self._status_cache.pop(device_serial, None)
+        else:
+            self._props_cache.clear()
+            self._status_cache.clear()
+    
+    @staticmethod
+    def _cache_get(cache: Dict[str, Tuple[float, Dict[str, Any]]], device_serial: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a cached entry if it is younger than ttl, else None."""
+        entry = cache.get(device_serial)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+    
+    def _cached_props(self, device_serial: str) -> Optional[Dict[str, Any]]:
+        """Cached properties for a device, or None if missing/expired."""
+        return self._cache_get(self._props_cache, device_serial, _PROPS_TTL)
     
     def _get_device_properties(self, device_serial: str) -> Dict[str, Any]:
         """Get comprehensive device properties."""
-        props = {}
+        return self._get_device_properties_many([device_serial])[0]
+    
+    def _get_device_properties_many(self, device_serials: List[str]) -> List[Dict[str, Any]]:
+        """Get device properties for several devices, querying uncached ones concurrently."""
+        cached = {serial: self._cached_props(serial) for serial in dict.fromkeys(device_serials)}
+        missing = [serial for serial, props in cached.items() if props is None]
+        # A bare `getprop` dumps every property in one round-trip
+        results = self.adb.shell_many([(serial, "getprop") for serial in missing])
         
-        # Basic device info
-        prop_commands = {
-            'manufacturer': 'ro.product.manufacturer',
-            'model': 'ro.product.model',
-            'brand': 'ro.product.brand',
-            'device': 'ro.product.device',
-            'android_version': 'ro.build.version.release',
-            'sdk_version': 'ro.build.version.sdk',
-            'build_id': 'ro.build.id',
-            'serial': 'ro.serialno',
-        }
+        now = time.monotonic()
+        for serial, raw in zip(missing, results):
+            props = cached[serial] = self._parse_props(raw)
+            # Don't remember a device that failed to answer at all
+            if any(value != "Unknown" for value in props.values()):
+                self._props_cache[serial] = (now, props)
         
-        for key, prop in prop_commands.items():
-            result = self.adb.shell(f"getprop {prop}", device_serial)
-            props[key] = result if result else "Unknown"
-        
-        return props
+        return [dict(cached[serial]) for serial in device_serials]
+    
+    @staticmethod
+    def _parse_props(raw: str) -> Dict[str, Any]:
+        """Pick the _PROP_COMMANDS properties out of full `getprop` output."""
+        all_props = dict(_GETPROP_RE.findall(raw)) if raw else {}
+        return {key: all_props.get(prop) or "Unknown" for key, prop in _PROP_COMMANDS.items()}
     
     def _get_device_status(self, device_serial: str) -> Dict[str, Any]:
-        """Get device status information."""
+        """Get device status information (cached for _STATUS_TTL seconds)."""
+        cached = self._cache_get(self._status_cache, device_serial, _STATUS_TTL)
+        if cached is not None:
+            return dict(cached)
+        
         status = {}
+        battery, screen, wifi = self._shell_outputs(_STATUS_COMMANDS, device_serial)
         
         # Battery info
-        battery = self.adb.shell("dumpsys battery", device_serial)
         if battery:
-            for line in battery.split('\n'):
-                if 'level:' in line:
-                    status['battery_level'] = line.split(':')[1].strip()
-                elif 'status:' in line:
-                    status['battery_status'] = line.split(':')[1].strip()
+            battery_info = _parse_battery(battery)
+            if battery_info.get('level'):
+                status['battery_level'] = battery_info['level']
+            if battery_info.get('status'):
+                status['battery_status'] = battery_info['status']
         
         # Screen status
-        screen = self.adb.shell("dumpsys power | grep 'Display Power'", device_serial)
         status['screen_on'] = 'ON' if screen and 'state=ON' in screen else 'OFF'
         
         # WiFi status
-        wifi = self.adb.shell("dumpsys wifi | grep 'Wi-Fi is'", device_serial)
         status['wifi_enabled'] = wifi and 'enabled' in wifi.lower()
         
-        return status
+        self._status_cache[device_serial] = (time.monotonic(), status)
+        return dict(status)
+    
+    def _shell_outputs(self, commands: Tuple[str, ...], device_serial: str) -> List[str]:
+        """Run commands in one round-trip; output per command, empty string on failure."""
+        return [stdout if ok else "" for ok, stdout, _ in self.adb.shell_batch(list(commands), device_serial)]
+
+
+def _parse_battery(battery_output: str) -> Dict[str, str]:
+    """Parse `dumpsys battery` output into a field -> value dict."""
+    return dict(_BATTERY_FIELD_RE.findall(battery_output))
 
 
 # Initialize global device manager
@@ -85,11 +177,12 @@ def list_android_devices() -> str:
             "devices": []
         })
     
+    # devices is a list of dicts like [{'serial': 'ABC123', 'status': 'device'}]
+    serials = [device.get('serial') if isinstance(device, dict) else device for device in devices]
+    props_list = _device_manager._get_device_properties_many(serials)
+    
     device_list = []
-    for device in devices:
-        # devices is a list of dicts like [{'serial': 'ABC123', 'status': 'device'}]
-        serial = device.get('serial') if isinstance(device, dict) else device
-        props = _device_manager._get_device_properties(serial)
+    for serial, props in zip(serials, props_list):
         device_list.append({
             "serial": serial,
             "manufacturer": props.get('manufacturer', 'Unknown'),
@@ -118,21 +211,20 @@ def get_device_info(device_serial: Optional[str] = None) -> str:
     Returns:
         str: JSON string with detailed device information
     """
+    # One enumeration serves both the default-device pick and the existence check
+    devices = _device_manager.adb.get_devices()
+    device_serials = [d.get('serial') if isinstance(d, dict) else d for d in devices]
+    
     # If no serial provided, use first available device
     if not device_serial:
-        devices = _device_manager.adb.get_devices()
-        if not devices:
+        if not device_serials:
             return json.dumps({
                 "status": "error",
                 "message": "No devices connected"
             })
-        # Handle dict format from get_devices()
-        device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+        device_serial = device_serials[0]
     
     # Verify device exists
-    devices = _device_manager.adb.get_devices()
-    device_serials = [d.get('serial') if isinstance(d, dict) else d for d in devices]
-    
     if device_serial not in device_serials:
         return json.dumps({
             "status": "error",
@@ -140,9 +232,15 @@ def get_device_info(device_serial: Optional[str] = None) -> str:
             "available_devices": device_serials
         })
     
-    # Get device properties and status
-    props = _device_manager._get_device_properties(device_serial)
-    status = _device_manager._get_device_status(device_serial)
+    # Get device properties and status; a props cache miss is fetched alongside the status queries
+    if _device_manager._cached_props(device_serial) is not None:
+        props = _device_manager._get_device_properties(device_serial)
+        status = _device_manager._get_device_status(device_serial)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            props_future = executor.submit(_device_manager._get_device_properties, device_serial)
+            status = _device_manager._get_device_status(device_serial)
+            props = props_future.result()
     
     return json.dumps({
         "status": "success",
@@ -181,12 +279,7 @@ def get_device_battery_info(device_serial: Optional[str] = None) -> str:
             "message": "Failed to get battery info"
         })
     
-    battery_info = {}
-    for line in battery_output.split('\n'):
-        line = line.strip()
-        if ':' in line:
-            key, value = line.split(':', 1)
-            battery_info[key.strip()] = value.strip()
+    battery_info = _parse_battery(battery_output)
     
     return json.dumps({
         "status": "success",
@@ -236,6 +329,10 @@ def reboot_device(device_serial: Optional[str] = None, mode: str = "normal") ->
     
     result = _device_manager.adb._run_adb(cmd)
     
+    # The device drops off the bus while rebooting and may come back reflashed
+    ADBClient.invalidate_devices_cache()
+    _device_manager.clear_cache(device_serial)
+    
     if result[0]:  # Check success (first element of tuple)
         return json.dumps({
             "status": "success",
@@ -271,23 +368,20 @@ def get_device_screen_info(device_serial: Optional[str] = None) -> str:
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     screen_info = {}
+    size, density, power, orientation = _device_manager._shell_outputs(_SCREEN_COMMANDS, device_serial)
     
     # Get screen size
-    size = _device_manager.adb.shell("wm size", device_serial)
     if size and 'Physical size:' in size:
         screen_info['resolution'] = size.split('Physical size:')[1].strip()
     
     # Get screen density
-    density = _device_manager.adb.shell("wm density", device_serial)
     if density and 'Physical density:' in density:
         screen_info['density'] = density.split('Physical density:')[1].strip()
     
     # Get screen state
-    power = _device_manager.adb.shell("dumpsys power | grep 'Display Power'", device_serial)
     screen_info['screen_on'] = 'ON' if power and 'state=ON' in power else 'OFF'
     
     # Get orientation
-    orientation = _device_manager.adb.shell("dumpsys input | grep 'SurfaceOrientation'", device_serial)
     if orientation:
         screen_info['orientation'] = orientation.strip()
     
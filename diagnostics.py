@@ -1,16 +1,191 @@
 """Diagnostics tools for Android devices."""
+import atexit
 import json
 import os
-from typing import Optional
+import re
+import struct
+import subprocess
+import threading
+from collections import deque
+from typing import Dict, List, Optional
 from langchain_core.tools import tool
-from .adb_client import ADBClient
+from .adb_client import ADBClient, _ADB, get_background_task, submit_background
+from ._lazy import LazyObject
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots fall back to `screencap -p`
+    Image = None
+
+
+# Level and tag of a `logcat -v threadtime` line:
+# "MM-DD HH:MM:SS.mmm  PID  TID L TAG: message"
+_LOGCAT_LINE_RE = LazyObject(
+    lambda: re.compile(r"^\S+ \S+\s+\d+\s+\d+ ([VDIWEFS]) (.*?)\s*: "), globals(), "_LOGCAT_LINE_RE"
+)
+_LOG_LEVELS = "VDIWEFS"
+
+# Tag of the marker line a new tailer writes to find the end of the log history
+_TAILER_MARKER_TAG = "DroidworkTailer"
+
+
+class _LogcatTailer:
+    """
+    Long-running ``adb logcat`` per device, buffered in memory.
+    
+    Re-running ``adb logcat -d`` for every query spawns adb and re-dumps the
+    whole ring buffer. The tailer keeps one follower process per device and
+    answers queries from the most recent lines it has seen.
+    
+    On start the follower replays the device's whole ring buffer, so the
+    tailer logs a marker line of its own and only serves queries once that
+    line has come through.
+    """
+    
+    _TAILERS: Dict[str, "_LogcatTailer"] = {}
+    _LOCK = threading.Lock()
+    
+    @classmethod
+    def get(cls, device_serial: str) -> Optional["_LogcatTailer"]:
+        """
+        Get the running tailer for a device, starting one if needed.
+        
+        Returns None while the tailer is still replaying the device's log
+        history (including right after it was started), so the caller should
+        query adb directly.
+        """
+        with cls._LOCK:
+            tailer = cls._TAILERS.get(device_serial)
+            if tailer is not None and tailer.alive():
+                return tailer if tailer.caught_up.is_set() else None
+            try:
+                cls._TAILERS[device_serial] = cls(device_serial)
+            except OSError:
+                pass
+            return None
+    
+    @classmethod
+    def stop_all(cls):
+        """Stop every tailer (registered with atexit)."""
+        with cls._LOCK:
+            tailers = list(cls._TAILERS.values())
+            cls._TAILERS.clear()
+        for tailer in tailers:
+            tailer.stop()
+    
+    def __init__(self, device_serial: str, max_lines: int = 100_000):
+        self.lines: deque = deque(maxlen=max_lines)
+        self.caught_up = threading.Event()
+        self._device_serial = device_serial
+        self._marker_token = os.urandom(8).hex()
+        self._proc = subprocess.Popen(
+            [_ADB, "-s", device_serial, "logcat", "-v", "threadtime"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace"
+        )
+        threading.Thread(target=self._pump, daemon=True).start()
+    
+    def _pump(self):
+        """Append log lines to the ring buffer until logcat exits."""
+        # Logged after logcat started, so it arrives after the history replay
+        marker = f"{_TAILER_MARKER_TAG}: {self._marker_token}"
+        ADBClient.get(self._device_serial).shell(
+            f"log -t {_TAILER_MARKER_TAG} {self._marker_token}", self._device_serial
+        )
+        for line in self._proc.stdout:
+            line = line.rstrip("\n")
+            if not self.caught_up.is_set() and line.endswith(marker):
+                self.caught_up.set()
+                continue
+            self.lines.append(line)
+    
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+    
+    def stop(self):
+        if self.alive():
+            self._proc.terminate()
+    
+    def tail(self, lines: int, filter_tag: Optional[str] = None, filter_level: Optional[str] = None) -> List[str]:
+        """
+        Get the last matching lines, mirroring `logcat -d -t N <filterspec>`.
+        
+        Args:
+            lines: Maximum number of lines to return
+            filter_tag: Only lines with this tag
+            filter_level: Only lines at this level or above
+        
+        Returns:
+            Matching lines, oldest first
+        """
+        snapshot = list(self.lines)
+        if not filter_tag and not filter_level:
+            return snapshot[-lines:] if lines > 0 else []
+        
+        min_level = _LOG_LEVELS.find(filter_level.upper()) if filter_level else 0
+        matched = []
+        for line in reversed(snapshot):
+            if len(matched) >= lines:
+                break
+            m = _LOGCAT_LINE_RE.match(line)
+            if not m:
+                continue
+            if filter_tag and m.group(2) != filter_tag:
+                continue
+            if _LOG_LEVELS.find(m.group(1)) >= min_level:
+                matched.append(line)
+        
+        matched.reverse()
+        return matched
+
+
+atexit.register(_LogcatTailer.stop_all)
+
+
+# PIXEL_FORMAT_RGBA_8888 in raw `screencap` output
+_RAW_RGBA_8888 = 1
+
+
+def _save_raw_screencap(raw: bytes, output_path: str) -> bool:
+    """
+    Encode raw `screencap` output to an image file on the host.
+    
+    The raw dump is a little-endian header (width, height, format, plus a
+    colorspace word on Android 9+) followed by RGBA pixels. Encoding here
+    instead of with `screencap -p` moves compression off the device CPU.
+    
+    Args:
+        raw: Bytes from `adb exec-out screencap`
+        output_path: Destination; .jpg/.jpeg saves JPEG, anything else PNG
+    
+    Returns:
+        True if the image was written, False if raw could not be decoded
+    """
+    if Image is None or len(raw) < 12:
+        return False
+    
+    width, height, pixel_format = struct.unpack_from("<III", raw)
+    header_size = len(raw) - width * height * 4
+    if pixel_format != _RAW_RGBA_8888 or header_size not in (12, 16):
+        return False
+    
+    img = Image.frombuffer("RGBA", (width, height), memoryview(raw)[header_size:], "raw", "RGBA", 0, 1)
+    if output_path.lower().endswith((".jpg", ".jpeg")):
+        img.convert("RGB").save(output_path, "JPEG", quality=85)
+    else:
+        # Fast zlib level: the file is local, size matters less than latency
+        img.save(output_path, "PNG", compress_level=1)
+    return True
 
 
 class DiagnosticsManager:
     """Manager for device diagnostics."""
     
     def __init__(self):
-        self.adb = ADBClient()
+        self.adb = ADBClient.get()
 
 
 _manager = DiagnosticsManager()
@@ -47,23 +222,24 @@ def take_screenshot(output_path: Optional[str] = None, device_serial: Optional[s
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     try:
-        adb = ADBClient(device_serial)
-        
-        # Capture screenshot to device temp location
-        device_temp = "/sdcard/screenshot_temp.png"
-        success, stdout, stderr = adb._run_adb(["shell", "screencap", "-p", device_temp])
+        # Pull raw pixels and encode on the host when Pillow is available
+        if Image is not None:
+            raw = _manager.adb.exec_out("screencap", device_serial)
+            if _save_raw_screencap(raw, output_path):
+                return json.dumps({
+                    "success": True,
+                    "path": output_path,
+                    "device": device_serial
+                })
         
-        if not success:
-            return json.dumps({"success": False, "error": f"Failed to capture: {stderr}"})
+        # Stream the PNG straight off the device (no temp file, no pull)
+        png = _manager.adb.exec_out("screencap -p", device_serial)
         
-        # Pull to Mac
-        success, stdout, stderr = adb._run_adb(["pull", device_temp, output_path])
+        if not png.startswith(b"\x89PNG"):
+            return json.dumps({"success": False, "error": "Failed to capture screenshot"})
         
-        if not success:
-            return json.dumps({"success": False, "error": f"Failed to pull: {stderr}"})
-        
-        # Clean up temp file on device
-        adb._run_adb(["shell", "rm", device_temp])
+        with open(output_path, "wb") as f:
+            f.write(png)
         
         return json.dumps({
             "success": True,
@@ -101,7 +277,18 @@ def get_logcat(
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
+        # Serve repeat queries from the device's in-memory log tail
+        tailer = _LogcatTailer.get(device_serial)
+        if tailer is not None:
+            log_lines = tailer.tail(lines, filter_tag, filter_level)
+            return json.dumps({
+                "success": True,
+                "lines_returned": len(log_lines),
+                "logs": "\n".join(log_lines),
+                "device": device_serial
+            })
+        
+        adb = ADBClient.get(device_serial)
         
         # Build logcat command
         cmd = ["shell", "logcat", "-d", "-t", str(lines)]
@@ -121,11 +308,12 @@ def get_logcat(
         if not success:
             return json.dumps({"success": False, "error": f"Failed to get logs: {stderr}"})
         
-        log_lines = stdout.strip().split('\n') if stdout.strip() else []
+        # Count lines in place rather than materializing a list of them
+        lines_returned = stdout.count('\n') + 1 if stdout else 0
         
         return json.dumps({
             "success": True,
-            "lines_returned": len(log_lines),
+            "lines_returned": lines_returned,
             "logs": stdout,
             "device": device_serial
         })
@@ -134,18 +322,54 @@ def get_logcat(
         return json.dumps({"success": False, "error": str(e)})
 
 
+def _capture_bugreport(output_path: str, device_serial: str) -> dict:
+    """Run `adb bugreport` to completion and describe the outcome."""
+    try:
+        adb = ADBClient.get(device_serial)
+        
+        # Capture bugreport (timeout 180 seconds = 3 minutes)
+        success, stdout, stderr = adb._run_adb(
+            ["bugreport", output_path],
+            timeout=180
+        )
+        
+        if not success:
+            return {"success": False, "error": f"Failed to capture bugreport: {stderr}"}
+        
+        # Check if file was created
+        if os.path.exists(output_path):
+            file_size = os.path.getsize(output_path)
+            return {
+                "success": True,
+                "path": output_path,
+                "size_bytes": file_size,
+                "device": device_serial
+            }
+        else:
+            return {"success": False, "error": "Bugreport file not created"}
+    
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 @tool
-def capture_bugreport(output_path: Optional[str] = None, device_serial: Optional[str] = None) -> str:
+def capture_bugreport(
+    output_path: Optional[str] = None,
+    device_serial: Optional[str] = None,
+    wait: bool = False
+) -> str:
     """Capture a full bug report from the Android device.
     
-    Note: This can take 1-3 minutes to complete.
+    Note: This can take 1-3 minutes to complete. By default it runs in the
+    background and returns a task_id; poll it with get_task_status.
     
     Args:
         output_path: Where to save on Mac (default: ~/Downloads/bugreport_<timestamp>.zip)
         device_serial: Device serial (optional, uses first device if not specified)
+        wait: Block until the bug report is written instead of running in the background
     
     Returns:
-        JSON string with success status and file path
+        JSON string with success status and task id (or file path when wait=True)
     """
     import time
     
@@ -166,29 +390,39 @@ def capture_bugreport(output_path: Optional[str] = None, device_serial: Optional
     # Ensure directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
+    if wait:
+        return json.dumps(_capture_bugreport(output_path, device_serial))
+    
+    task_id = submit_background(_capture_bugreport, output_path, device_serial)
+    return json.dumps({
+        "success": True,
+        "task_id": task_id,
+        "status": "running",
+        "path": output_path,
+        "device": device_serial
+    })
+
+
+@tool
+def get_task_status(task_id: str) -> str:
+    """Check on a background task started by another tool (e.g. capture_bugreport).
+    
+    Args:
+        task_id: Task id returned when the task was started
+    
+    Returns:
+        JSON string with the task status, and the task's result once it is done
+    """
+    future = get_background_task(task_id)
+    if future is None:
+        return json.dumps({"success": False, "error": f"Unknown task: {task_id}"})
+    
+    if not future.done():
+        return json.dumps({"success": True, "task_id": task_id, "status": "running"})
+    
     try:
-        adb = ADBClient(device_serial)
-        
-        # Capture bugreport (timeout 180 seconds = 3 minutes)
-        success, stdout, stderr = adb._run_adb(
-            ["bugreport", output_path], 
-            timeout=180
-        )
-        
-        if not success:
-            return json.dumps({"success": False, "error": f"Failed to capture bugreport: {stderr}"})
-        
-        # Check if file was created
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
-            return json.dumps({
-                "success": True,
-                "path": output_path,
-                "size_bytes": file_size,
-                "device": device_serial
-            })
-        else:
-            return json.dumps({"success": False, "error": "Bugreport file not created"})
-        
+        result = future.result()
     except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+        return json.dumps({"success": False, "task_id": task_id, "status": "failed", "error": str(e)})
+        
+    return json.dumps({"success": True, "task_id": task_id, "status": "done", "result": result})
@@ -11,7 +11,9 @@ import json
 import time
 import sys
 import os
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from shlex import quote as _q
+from typing import Optional, Dict, Any, Tuple, Callable, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,9 +22,60 @@ sys.path.insert(0, os.path.expanduser("~/deepagents/libs/deepagents"))
 
 from .config import VLA_CONFIG
 
+# android_tools are imported once per process; the _execute_* methods call the
+# tools' bound .invoke methods directly, skipping the attribute lookup per action
+try:
+    from deepagents.android_tools.adb_client import ADBClient as _ADBClient
+    from deepagents.android_tools import (
+        tap as _tap,
+        long_press as _long_press,
+        swipe as _swipe,
+        drag as _drag,
+        input_text as _input_text,
+        press_key as _press_key,
+        start_app as _start_app,
+        stop_app as _stop_app,
+    )
+    _tap_invoke = _tap.invoke
+    _long_press_invoke = _long_press.invoke
+    _swipe_invoke = _swipe.invoke
+    _drag_invoke = _drag.invoke
+    _input_text_invoke = _input_text.invoke
+    _press_key_invoke = _press_key.invoke
+    _start_app_invoke = _start_app.invoke
+except ImportError as e:
+    print(f"Warning: Could not load android_tools: {e}")
+    _ADBClient = _tap = _long_press = _swipe = _drag = None
+    _input_text = _press_key = _start_app = _stop_app = None
+    _tap_invoke = _long_press_invoke = _swipe_invoke = _drag_invoke = None
+    _input_text_invoke = _press_key_invoke = _start_app_invoke = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional speedup
+    _json_loads = json.loads
+
+# Shared by Executor.execute_on_all(); adb calls are I/O-bound, so one
+# thread per device overlaps the round-trips
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vla-exec")
+
+# How successful tool results start (stdlib json.dumps / compact orjson output)
+_SUCCESS_PREFIXES = ('{"success": true', '{"success":true')
+
 
 class ActionType(Enum):
-    """Supported action types"""
+    """Supported action types
+    
+    Each member also carries a dense ``index`` (definition order) so executors
+    can dispatch through a list instead of hashing the member.
+    """
+    
+    def __new__(cls, value: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = len(cls.__members__)
+        return member
+    
     TAP = "tap"
     LONG_PRESS = "long_press"
     SWIPE = "swipe"
@@ -39,6 +92,49 @@ class ActionType(Enum):
     TASK_FAILED = "task_failed"
 
 
+# Action names accepted in LLM output -> ActionType
+_ACTION_MAP: Dict[str, ActionType] = {
+    "tap": ActionType.TAP,
+    "long_press": ActionType.LONG_PRESS,
+    "swipe": ActionType.SWIPE,
+    "drag": ActionType.DRAG,
+    "input_text": ActionType.INPUT_TEXT,
+    "input": ActionType.INPUT_TEXT,
+    "type": ActionType.INPUT_TEXT,
+    "press_key": ActionType.PRESS_KEY,
+    "keypress": ActionType.PRESS_KEY,
+    "wait": ActionType.WAIT,
+    "scroll_up": ActionType.SCROLL_UP,
+    "scroll_down": ActionType.SCROLL_DOWN,
+    "go_back": ActionType.GO_BACK,
+    "back": ActionType.GO_BACK,
+    "go_home": ActionType.GO_HOME,
+    "home": ActionType.GO_HOME,
+    "open_app": ActionType.OPEN_APP,
+    "launch_app": ActionType.OPEN_APP,
+    "task_complete": ActionType.TASK_COMPLETE,
+    "done": ActionType.TASK_COMPLETE,
+    "complete": ActionType.TASK_COMPLETE,
+    "task_failed": ActionType.TASK_FAILED,
+    "fail": ActionType.TASK_FAILED,
+    "failed": ActionType.TASK_FAILED,
+}
+
+# Common key names -> Android keycodes
+_KEY_MAP = {
+    "back": "KEYCODE_BACK",
+    "home": "KEYCODE_HOME",
+    "enter": "KEYCODE_ENTER",
+    "delete": "KEYCODE_DEL",
+    "tab": "KEYCODE_TAB",
+    "menu": "KEYCODE_MENU",
+    "search": "KEYCODE_SEARCH",
+    "power": "KEYCODE_POWER",
+    "volume_up": "KEYCODE_VOLUME_UP",
+    "volume_down": "KEYCODE_VOLUME_DOWN",
+}
+
+
 @dataclass
 class Action:
     """Represents an action to execute"""
@@ -51,35 +147,7 @@ class Action:
         """Create Action from dictionary"""
         action_str = data.get("action", "").lower().replace(" ", "_")
         
-        # Map string to ActionType
-        action_map = {
-            "tap": ActionType.TAP,
-            "long_press": ActionType.LONG_PRESS,
-            "swipe": ActionType.SWIPE,
-            "drag": ActionType.DRAG,
-            "input_text": ActionType.INPUT_TEXT,
-            "input": ActionType.INPUT_TEXT,
-            "type": ActionType.INPUT_TEXT,
-            "press_key": ActionType.PRESS_KEY,
-            "keypress": ActionType.PRESS_KEY,
-            "wait": ActionType.WAIT,
-            "scroll_up": ActionType.SCROLL_UP,
-            "scroll_down": ActionType.SCROLL_DOWN,
-            "go_back": ActionType.GO_BACK,
-            "back": ActionType.GO_BACK,
-            "go_home": ActionType.GO_HOME,
-            "home": ActionType.GO_HOME,
-            "open_app": ActionType.OPEN_APP,
-            "launch_app": ActionType.OPEN_APP,
-            "task_complete": ActionType.TASK_COMPLETE,
-            "done": ActionType.TASK_COMPLETE,
-            "complete": ActionType.TASK_COMPLETE,
-            "task_failed": ActionType.TASK_FAILED,
-            "fail": ActionType.TASK_FAILED,
-            "failed": ActionType.TASK_FAILED,
-        }
-        
-        action_type = action_map.get(action_str, ActionType.WAIT)
+        action_type = _ACTION_MAP.get(action_str, ActionType.WAIT)
         
         return cls(
             action_type=action_type,
@@ -88,14 +156,112 @@ class Action:
         )
 
 
-@dataclass
 class ActionResult:
-    """Result of an executed action"""
-    success: bool
-    action: Action
-    message: str = ""
-    error: Optional[str] = None
-    duration_ms: int = 0
+    """Result of an executed action
+    
+    Keeps the perf_counter_ns() readings taken around the action and derives
+    duration_ms from them on access. Passing duration_ms directly still works.
+    """
+    __slots__ = ("success", "action", "message", "error", "_start_ns", "_end_ns")
+    
+    def __init__(
+        self,
+        success: bool,
+        action: Action,
+        message: str = "",
+        error: Optional[str] = None,
+        duration_ms: int = 0,
+        *,
+        start_ns: int = 0,
+        end_ns: Optional[int] = None
+    ):
+        self.success = success
+        self.action = action
+        self.message = message
+        self.error = error
+        self._start_ns = start_ns
+        self._end_ns = start_ns + duration_ms * 1_000_000 if end_ns is None else end_ns
+    
+    @property
+    def duration_ms(self) -> int:
+        """Wall time of the action in whole milliseconds"""
+        return (self._end_ns - self._start_ns) // 1_000_000
+    
+    def __repr__(self) -> str:
+        return (
+            f"ActionResult(success={self.success!r}, action={self.action!r}, message={self.message!r}, "
+            f"error={self.error!r}, duration_ms={self.duration_ms!r})"
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.success, self.action, self.message, self.error, self.duration_ms) == (
+            other.success, other.action, other.message, other.error, other.duration_ms
+        )
+    
+    __hash__ = None
+
+
+# Swipe/drag coordinate keys and the short aliases LLMs also emit
+_SWIPE_ALIASES = (("start_x", "x1"), ("start_y", "y1"), ("end_x", "x2"), ("end_y", "y2"))
+
+
+def _as_int(value: Any) -> int:
+    """int(value), skipping the call when value already is an int."""
+    return value if type(value) is int else int(value)
+
+
+def _swipe_coords(params: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    """(start_x, start_y, end_x, end_y) from params; canonical keys win over aliases."""
+    return tuple([
+        _as_int(params[key] if key in params else params.get(alias, 0))
+        for key, alias in _SWIPE_ALIASES
+    ])
+
+
+# =============================================================================
+# Shell commands for execute_batch()
+# =============================================================================
+
+def _escape_input_text(text: str) -> str:
+    """Quote text for `input text` the same way android_tools.input_text does."""
+    return _q(text.replace(" ", "%s"))
+
+
+def _swipe_command(params: Dict[str, Any], verb: str, default_duration: int) -> str:
+    start_x, start_y, end_x, end_y = _swipe_coords(params)
+    return f"input {verb} {start_x} {start_y} {end_x} {end_y} {_as_int(params.get('duration_ms', default_duration))}"
+
+
+def _scroll_command(params: Dict[str, Any], start_y: int, end_y: int) -> str:
+    x = int(params.get("x", 540))
+    return f"input swipe {x} {int(params.get('start_y', start_y))} {x} {int(params.get('end_y', end_y))} 300"
+
+
+def _key_command(params: Dict[str, Any]) -> str:
+    key = str(params.get("key", params.get("keycode", "")))
+    return f"input keyevent {_q(_KEY_MAP.get(key.lower(), key))}"
+
+
+# ActionType -> params -> one `input` command, mirroring the android_tools
+# each _execute_* method invokes
+_INPUT_COMMANDS: Dict[ActionType, Callable[[Dict[str, Any]], str]] = {
+    ActionType.TAP: lambda p: f"input tap {int(p.get('x', 0))} {int(p.get('y', 0))}",
+    ActionType.LONG_PRESS: lambda p: (
+        f"input swipe {int(p.get('x', 0))} {int(p.get('y', 0))} "
+        f"{int(p.get('x', 0))} {int(p.get('y', 0))} {int(p.get('duration_ms', 1000))}"
+    ),
+    ActionType.SWIPE: lambda p: _swipe_command(p, "swipe", 300),
+    # draganddrop is missing on older Android; fall back to a slow swipe
+    ActionType.DRAG: lambda p: f"{_swipe_command(p, 'draganddrop', 1000)} || {_swipe_command(p, 'swipe', 1000)}",
+    ActionType.INPUT_TEXT: lambda p: f"input text {_escape_input_text(str(p.get('text', '')))}",
+    ActionType.PRESS_KEY: _key_command,
+    ActionType.SCROLL_UP: lambda p: _scroll_command(p, 1500, 500),
+    ActionType.SCROLL_DOWN: lambda p: _scroll_command(p, 500, 1500),
+    ActionType.GO_BACK: lambda p: "input keyevent KEYCODE_BACK",
+    ActionType.GO_HOME: lambda p: "input keyevent KEYCODE_HOME",
+}
 
 
 class Executor:
@@ -109,33 +275,36 @@ class Executor:
     
     def __init__(self, device_serial: Optional[str] = None):
         self.device_serial = device_serial
-        self._load_android_tools()
-    
-    def _load_android_tools(self):
-        """Load android_tools functions"""
-        try:
-            from deepagents.android_tools import (
-                tap,
-                long_press,
-                swipe,
-                drag,
-                input_text,
-                press_key,
-                start_app,
-                stop_app,
-            )
-            self._tap = tap
-            self._long_press = long_press
-            self._swipe = swipe
-            self._drag = drag
-            self._input_text = input_text
-            self._press_key = press_key
-            self._start_app = start_app
-            self._stop_app = stop_app
-            self._tools_loaded = True
-        except ImportError as e:
-            print(f"Warning: Could not load android_tools: {e}")
-            self._tools_loaded = False
+        
+        handlers = {
+            ActionType.TAP: self._execute_tap,
+            ActionType.LONG_PRESS: self._execute_long_press,
+            ActionType.SWIPE: self._execute_swipe,
+            ActionType.DRAG: self._execute_drag,
+            ActionType.INPUT_TEXT: self._execute_input_text,
+            ActionType.PRESS_KEY: self._execute_press_key,
+            ActionType.WAIT: self._execute_wait,
+            ActionType.SCROLL_UP: self._execute_scroll_up,
+            ActionType.SCROLL_DOWN: self._execute_scroll_down,
+            ActionType.GO_BACK: self._execute_go_back,
+            ActionType.GO_HOME: self._execute_go_home,
+            ActionType.OPEN_APP: self._execute_open_app,
+            ActionType.TASK_COMPLETE: lambda params: (True, "Task marked as complete"),
+            ActionType.TASK_FAILED: lambda params: (False, "Task marked as failed"),
+        }
+        # ActionType.index -> handler(params); one list index per action
+        self._dispatch = [handlers[action_type] for action_type in ActionType]
+        
+        # Prebuilt kwargs for the hot-path tools. Handlers fill in a copy, never
+        # the template itself: invoke() hands its input to LangChain callbacks,
+        # which may keep a reference to it
+        self._tap_kwargs = {"x": 0, "y": 0, "device_serial": device_serial}
+        self._long_press_kwargs = {"x": 0, "y": 0, "duration_ms": 1000, "device_serial": device_serial}
+        self._swipe_kwargs = {
+            "start_x": 0, "start_y": 0, "end_x": 0, "end_y": 0,
+            "duration_ms": 300, "device_serial": device_serial
+        }
+        self._drag_kwargs = {**self._swipe_kwargs, "duration_ms": 1000}
     
     def execute(self, action: Action) -> ActionResult:
         """
@@ -147,63 +316,138 @@ class Executor:
         Returns:
             ActionResult with success status
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            if action.action_type == ActionType.TAP:
-                result = self._execute_tap(action.params)
-            elif action.action_type == ActionType.LONG_PRESS:
-                result = self._execute_long_press(action.params)
-            elif action.action_type == ActionType.SWIPE:
-                result = self._execute_swipe(action.params)
-            elif action.action_type == ActionType.DRAG:
-                result = self._execute_drag(action.params)
-            elif action.action_type == ActionType.INPUT_TEXT:
-                result = self._execute_input_text(action.params)
-            elif action.action_type == ActionType.PRESS_KEY:
-                result = self._execute_press_key(action.params)
-            elif action.action_type == ActionType.WAIT:
-                result = self._execute_wait(action.params)
-            elif action.action_type == ActionType.SCROLL_UP:
-                result = self._execute_scroll_up(action.params)
-            elif action.action_type == ActionType.SCROLL_DOWN:
-                result = self._execute_scroll_down(action.params)
-            elif action.action_type == ActionType.GO_BACK:
-                result = self._execute_go_back()
-            elif action.action_type == ActionType.GO_HOME:
-                result = self._execute_go_home()
-            elif action.action_type == ActionType.OPEN_APP:
-                result = self._execute_open_app(action.params)
-            elif action.action_type == ActionType.TASK_COMPLETE:
-                result = (True, "Task marked as complete")
-            elif action.action_type == ActionType.TASK_FAILED:
-                result = (False, "Task marked as failed")
+            handler = self._dispatch[action.action_type.index]
+        except AttributeError:  # Not an ActionType
+            handler = None
+        
+        try:
+            if handler is not None:
+                result = handler(action.params)
             else:
                 result = (False, f"Unknown action type: {action.action_type}")
             
-            duration_ms = int((time.time() - start_time) * 1000)
-            
             return ActionResult(
                 success=result[0],
                 action=action,
                 message=result[1],
-                duration_ms=duration_ms
+                start_ns=start_ns,
+                end_ns=time.perf_counter_ns()
             )
             
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
             return ActionResult(
                 success=False,
                 action=action,
                 message="Execution failed",
                 error=str(e),
-                duration_ms=duration_ms
+                start_ns=start_ns,
+                end_ns=time.perf_counter_ns()
             )
     
+    def execute_on_all(self, action: Action, serials: List[str]) -> List[ActionResult]:
+        """
+        Execute the same action on several devices in parallel.
+        
+        Each device runs the action through its shared Executor (see
+        _get_executor()) on a module-wide thread pool.
+        
+        Args:
+            action: Action to execute
+            serials: Device serial numbers
+            
+        Returns:
+            One ActionResult per serial, in the order of serials
+        """
+        futures = [_POOL.submit(_get_executor(serial).execute, action) for serial in serials]
+        return [future.result() for future in futures]
+    
+    def execute_batch(self, actions: List[Action]) -> List[ActionResult]:
+        """
+        Execute a sequence of actions, sending runs of plain input actions
+        (tap, swipe, key presses, text, scrolls) to the device in one round-trip.
+        
+        The commands go through the device's persistent adb shell session
+        (ADBClient.shell_batch) instead of one `adb shell input ...` process
+        per action. Actions without a single shell equivalent (wait, open_app,
+        task markers) run through execute() between runs, so order is kept.
+        
+        Args:
+            actions: Actions to execute in order
+            
+        Returns:
+            One ActionResult per action. Batched actions share the run's wall
+            time evenly in duration_ms.
+        """
+        results = []
+        pending: List[Tuple[Action, str]] = []
+        
+        for action in actions:
+            command = None
+            build = _INPUT_COMMANDS.get(action.action_type)
+            if build is not None:
+                try:
+                    command = build(action.params)
+                except (TypeError, ValueError):
+                    pass  # Bad params: let execute() report the error
+            
+            if command is None:
+                results.extend(self._run_input_batch(pending))
+                pending = []
+                results.append(self.execute(action))
+            else:
+                pending.append((action, command))
+        
+        results.extend(self._run_input_batch(pending))
+        return results
+    
+    def _run_input_batch(self, pending: List[Tuple[Action, str]]) -> List[ActionResult]:
+        """Run translated actions in one shell_batch round-trip."""
+        if not pending:
+            return []
+        
+        start_ns = time.perf_counter_ns()
+        try:
+            serial = self.device_serial
+            if not serial:
+                devices = _ADBClient.get().get_devices()
+                if not devices:
+                    raise RuntimeError("No devices connected")
+                serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
+            
+            outputs = _ADBClient.get(serial).shell_batch([command for _, command in pending], serial)
+        except Exception as e:
+            end_ns = time.perf_counter_ns()
+            return [
+                ActionResult(
+                    success=False, action=action, message="Execution failed", error=str(e),
+                    start_ns=start_ns, end_ns=end_ns
+                )
+                for action, _ in pending
+            ]
+        
+        share_ns = (time.perf_counter_ns() - start_ns) // len(pending)
+        return [
+            ActionResult(
+                success=ok,
+                action=action,
+                message="OK" if ok else (stdout or stderr or f"Command failed: {command}"),
+                start_ns=start_ns,
+                end_ns=start_ns + share_ns
+            )
+            for (action, command), (ok, stdout, stderr) in zip(pending, outputs)
+        ]
+    
     def _parse_tool_result(self, result: str) -> Tuple[bool, str]:
         """Parse JSON result from android_tools"""
+        # Common case: the tools put "success" first, so a success needs no parse
+        if result.startswith(_SUCCESS_PREFIXES):
+            return (True, "OK")
+        
         try:
-            data = json.loads(result)
+            data = _json_loads(result)
             success = data.get("success", False)
             message = data.get("error", "OK") if not success else "OK"
             return (success, message)
@@ -212,59 +456,49 @@ class Executor:
     
     def _execute_tap(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute tap action"""
-        x = params.get("x", 0)
-        y = params.get("y", 0)
+        kwargs = self._tap_kwargs.copy()
+        kwargs["x"] = int(params.get("x", 0))
+        kwargs["y"] = int(params.get("y", 0))
         
-        result = self._tap.invoke({
-            "x": int(x),
-            "y": int(y),
-            "device_serial": self.device_serial
-        })
+        result = _tap_invoke(kwargs)
         return self._parse_tool_result(result)
     
     def _execute_long_press(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute long press action"""
-        x = params.get("x", 0)
-        y = params.get("y", 0)
-        duration = params.get("duration_ms", 1000)
+        kwargs = self._long_press_kwargs.copy()
+        kwargs["x"] = int(params.get("x", 0))
+        kwargs["y"] = int(params.get("y", 0))
+        if "duration_ms" in params:
+            kwargs["duration_ms"] = int(params["duration_ms"])
         
-        result = self._long_press.invoke({
-            "x": int(x),
-            "y": int(y),
-            "duration_ms": int(duration),
-            "device_serial": self.device_serial
-        })
+        result = _long_press_invoke(kwargs)
         return self._parse_tool_result(result)
     
     def _execute_swipe(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute swipe action"""
-        result = self._swipe.invoke({
-            "start_x": int(params.get("start_x", params.get("x1", 0))),
-            "start_y": int(params.get("start_y", params.get("y1", 0))),
-            "end_x": int(params.get("end_x", params.get("x2", 0))),
-            "end_y": int(params.get("end_y", params.get("y2", 0))),
-            "duration_ms": int(params.get("duration_ms", 300)),
-            "device_serial": self.device_serial
-        })
+        kwargs = self._swipe_kwargs.copy()
+        kwargs["start_x"], kwargs["start_y"], kwargs["end_x"], kwargs["end_y"] = _swipe_coords(params)
+        if "duration_ms" in params:
+            kwargs["duration_ms"] = _as_int(params["duration_ms"])
+        
+        result = _swipe_invoke(kwargs)
         return self._parse_tool_result(result)
     
     def _execute_drag(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute drag action"""
-        result = self._drag.invoke({
-            "start_x": int(params.get("start_x", params.get("x1", 0))),
-            "start_y": int(params.get("start_y", params.get("y1", 0))),
-            "end_x": int(params.get("end_x", params.get("x2", 0))),
-            "end_y": int(params.get("end_y", params.get("y2", 0))),
-            "duration_ms": int(params.get("duration_ms", 1000)),
-            "device_serial": self.device_serial
-        })
+        kwargs = self._drag_kwargs.copy()
+        kwargs["start_x"], kwargs["start_y"], kwargs["end_x"], kwargs["end_y"] = _swipe_coords(params)
+        if "duration_ms" in params:
+            kwargs["duration_ms"] = _as_int(params["duration_ms"])
+        
+        result = _drag_invoke(kwargs)
         return self._parse_tool_result(result)
     
     def _execute_input_text(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute text input action"""
         text = params.get("text", "")
         
-        result = self._input_text.invoke({
+        result = _input_text_invoke({
             "text": str(text),
             "device_serial": self.device_serial
         })
@@ -274,23 +508,9 @@ class Executor:
         """Execute key press action"""
         key = params.get("key", params.get("keycode", ""))
         
-        # Map common key names to Android keycodes
-        key_map = {
-            "back": "KEYCODE_BACK",
-            "home": "KEYCODE_HOME",
-            "enter": "KEYCODE_ENTER",
-            "delete": "KEYCODE_DEL",
-            "tab": "KEYCODE_TAB",
-            "menu": "KEYCODE_MENU",
-            "search": "KEYCODE_SEARCH",
-            "power": "KEYCODE_POWER",
-            "volume_up": "KEYCODE_VOLUME_UP",
-            "volume_down": "KEYCODE_VOLUME_DOWN",
-        }
-        
-        keycode = key_map.get(str(key).lower(), str(key))
+        keycode = _KEY_MAP.get(str(key).lower(), str(key))
         
-        result = self._press_key.invoke({
+        result = _press_key_invoke({
             "keycode": keycode,
             "device_serial": self.device_serial
         })
@@ -299,7 +519,10 @@ class Executor:
     def _execute_wait(self, params: Dict[str, Any]) -> Tuple[bool, str]:
         """Execute wait action"""
         seconds = params.get("seconds", params.get("duration", 1))
-        time.sleep(float(seconds))
+        delay = seconds if type(seconds) in (int, float) else float(seconds)
+        # LLMs often emit "wait 0"; skip the syscall for zero/negative/sub-ms waits
+        if delay > 0.0005:
+            time.sleep(delay)
         return (True, f"Waited {seconds} seconds")
     
     def _execute_scroll_up(self, params: Dict[str, Any]) -> Tuple[bool, str]:
@@ -309,7 +532,7 @@ class Executor:
         start_y = params.get("start_y", 1500)
         end_y = params.get("end_y", 500)
         
-        result = self._swipe.invoke({
+        result = _swipe_invoke({
             "start_x": int(start_x),
             "start_y": int(start_y),
             "end_x": int(start_x),
@@ -325,7 +548,7 @@ class Executor:
         start_y = params.get("start_y", 500)
         end_y = params.get("end_y", 1500)
         
-        result = self._swipe.invoke({
+        result = _swipe_invoke({
             "start_x": int(start_x),
             "start_y": int(start_y),
             "end_x": int(start_x),
@@ -335,17 +558,17 @@ class Executor:
         })
         return self._parse_tool_result(result)
     
-    def _execute_go_back(self) -> Tuple[bool, str]:
+    def _execute_go_back(self, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """Press back button"""
-        result = self._press_key.invoke({
+        result = _press_key_invoke({
             "keycode": "KEYCODE_BACK",
             "device_serial": self.device_serial
         })
         return self._parse_tool_result(result)
     
-    def _execute_go_home(self) -> Tuple[bool, str]:
+    def _execute_go_home(self, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """Press home button"""
-        result = self._press_key.invoke({
+        result = _press_key_invoke({
             "keycode": "KEYCODE_HOME",
             "device_serial": self.device_serial
         })
@@ -355,7 +578,7 @@ class Executor:
         """Open/launch an app by package name"""
         package = params.get("package", params.get("app", ""))
         
-        result = self._start_app.invoke({
+        result = _start_app_invoke({
             "package_name": package,
             "device_serial": self.device_serial
         })
@@ -366,9 +589,21 @@ class Executor:
 # Convenience functions
 # =============================================================================
 
+# One Executor per device serial, shared by the convenience functions
+_EXECUTOR_CACHE: Dict[Optional[str], Executor] = {}
+
+
+def _get_executor(device_serial: Optional[str]) -> Executor:
+    """Get (or create) the shared Executor for a device."""
+    executor = _EXECUTOR_CACHE.get(device_serial)
+    if executor is None:
+        executor = _EXECUTOR_CACHE.setdefault(device_serial, Executor(device_serial))
+    return executor
+
+
 def tap_at(x: int, y: int, device_serial: str) -> bool:
     """Quick tap at coordinates"""
-    executor = Executor(device_serial)
+    executor = _get_executor(device_serial)
     action = Action(ActionType.TAP, {"x": x, "y": y})
     result = executor.execute(action)
     return result.success
@@ -376,7 +611,7 @@ def tap_at(x: int, y: int, device_serial: str) -> bool:
 
 def input_text(text: str, device_serial: str) -> bool:
     """Quick text input"""
-    executor = Executor(device_serial)
+    executor = _get_executor(device_serial)
     action = Action(ActionType.INPUT_TEXT, {"text": text})
     result = executor.execute(action)
     return result.success
@@ -384,7 +619,7 @@ def input_text(text: str, device_serial: str) -> bool:
 
 def go_back(device_serial: str) -> bool:
     """Quick back button press"""
-    executor = Executor(device_serial)
+    executor = _get_executor(device_serial)
     action = Action(ActionType.GO_BACK, {})
     result = executor.execute(action)
     return result.success
@@ -392,7 +627,7 @@ def go_back(device_serial: str) -> bool:
 
 def go_home(device_serial: str) -> bool:
     """Quick home button press"""
-    executor = Executor(device_serial)
+    executor = _get_executor(device_serial)
     action = Action(ActionType.GO_HOME, {})
     result = executor.execute(action)
     return result.success
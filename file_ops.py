@@ -3,42 +3,108 @@ File Operations - Android File Management Tools
 Provides LangChain tools for managing files on Android devices.
 Includes specialized tools for extracting app databases.
 """
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Optional
 from langchain_core.tools import tool
 from .adb_client import ADBClient
-import json
+from ._jsonutil import dumps as _dumps
+from ._lazy import LazyObject
+import base64
+import binascii
 import os
+import posixpath
 import re
+import tempfile
+from shlex import quote as _q
 
 
 class FileManager:
     """Manager for Android file operations via ADB."""
     
     def __init__(self):
-        self.adb = ADBClient()
+        self.adb = ADBClient.get()
 
 
 # Initialize global file manager
 _file_manager = FileManager()
 
+# Files up to this size are pulled via exec-out instead of adb pull
+_EXEC_OUT_MAX_BYTES = 16 * 1024 * 1024
+
 
 def _get_device_serial(device_serial: Optional[str] = None) -> tuple[str, Optional[str]]:
     """Get device serial, return (serial, error_json) - error_json is None if success."""
     if not device_serial:
         devices = _file_manager.adb.get_devices()
         if not devices:
-            return "", json.dumps({"success": False, "error": "No devices connected"})
+            return "", _dumps({"success": False, "error": "No devices connected"})
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     return device_serial, None
 
 
+def _shell_status(script: str, device_serial: str) -> tuple[str, str]:
+    """Run a shell script that ends by echoing a status token.
+    
+    Returns:
+        (token, output printed before it); token is '' if the shell failed
+    """
+    output = _file_manager.adb.shell(script, device_serial)
+    rest, _, token = output.rpartition('\n')
+    return token.strip(), rest.strip()
+
+
+# (divisor, suffix) per power of 1024, indexed by (bit_length - 1) // 10
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 * 1024, "MB"))
+
+
 def _format_size(size_bytes: int) -> str:
     """Format file size into human readable format."""
-    if size_bytes >= 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    if size_bytes >= 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    return f"{size_bytes} B"
+    divisor, suffix = _SIZE_UNITS[min(max(size_bytes.bit_length() - 1, 0) // 10, 2)]
+    if divisor == 1:
+        return f"{size_bytes} B"
+    return f"{size_bytes / divisor:.1f} {suffix}"
+
+
+# One `ls -la` line: permissions links owner group size date name
+_LS_LINE_RE = LazyObject(
+    lambda: re.compile(r'^([drwxlst-]+)\s+(\d+)\s+(\w+)\s+(\w+)\s+(\d+)\s+(\w+\s+\d+\s+[\d:]+)\s+(.+)$'),
+    globals(),
+    "_LS_LINE_RE"
+)
+
+
+def _ls_entry(perms: str, owner: str, group: str, size: str, date: str, name: str) -> dict:
+    """Build the file info dict for a fully parsed ls -la line."""
+    size = int(size)
+    return {
+        "name": name,
+        "permissions": perms,
+        "owner": owner,
+        "group": group,
+        "size": size,
+        "size_formatted": _format_size(size),
+        "date": date,
+        "is_directory": perms.startswith('d'),
+        "is_link": perms.startswith('l')
+    }
+
+
+def _parse_ls_fallback(parts: list[str]) -> Optional[dict]:
+    """Build a partial file info dict from an unrecognised line's split(None, 7) fields."""
+    if len(parts) == 8:
+        try:
+            size = int(parts[4])
+        except ValueError:
+            size = 0
+        return {
+            "name": parts[7].rstrip(),
+            "permissions": parts[0],
+            "size": size,
+            "size_formatted": _format_size(size),
+            "is_directory": parts[0].startswith('d')
+        }
+    return None
 
 
 def _parse_ls_line(line: str) -> Optional[dict]:
@@ -46,40 +112,59 @@ def _parse_ls_line(line: str) -> Optional[dict]:
     if line.startswith('total') or not line.strip():
         return None
     
-    # Match: permissions links owner group size date name
-    match = re.match(
-        r'^([drwxlst-]+)\s+(\d+)\s+(\w+)\s+(\w+)\s+(\d+)\s+(\w+\s+\d+\s+[\d:]+)\s+(.+)$',
-        line
-    )
+    # Fast path for toybox's `perms links owner group size YYYY-MM-DD HH:MM name`;
+    # maxsplit leaves the name (spaces and all) intact
+    parts = line.split(None, 7)
+    if (len(parts) == 8 and len(parts[0]) == 10 and parts[0][0] in 'dl-'
+            and parts[4].isdigit() and parts[5][4:5] == '-'):
+        perms, _links, owner, group, size, day, clock, name = parts
+        return _ls_entry(perms, owner, group, size, f"{day} {clock}", name)
+    
+    match = _LS_LINE_RE.match(line)
     if match:
-        perms, links, owner, group, size, date, name = match.groups()
-        return {
+        perms, _links, owner, group, size, date, name = match.groups()
+        return _ls_entry(perms, owner, group, size, date, name)
+    
+    return _parse_ls_fallback(parts)
+
+
+def _parse_ls_output(output: str) -> list[dict]:
+    """Parse a whole ls -la listing into file info dicts.
+    
+    Args:
+        output: Raw ls -la output
+    
+    Returns:
+        File info dicts in listing order ('total' and unparsable lines skipped)
+    """
+    return [info for info in map(_parse_ls_line, output.strip().splitlines()) if info]
+
+
+# find -printf row for list_files: type, permissions, owner, group, size, mtime, name
+_FIND_PRINTF = "%y\t%M\t%u\t%g\t%s\t%TY-%Tm-%Td %TH:%TM\t%f\n"
+
+
+def _parse_find_output(output: str) -> list[dict]:
+    """Parse _FIND_PRINTF rows into the same file info dicts _parse_ls_line builds."""
+    entries = []
+    for line in output.split('\n'):
+        fields = line.split('\t', 6)
+        if len(fields) != 7 or not fields[4].isdigit():
+            continue
+        kind, perms, owner, group, size, date, name = fields
+        size = int(size)
+        entries.append({
             "name": name,
             "permissions": perms,
             "owner": owner,
             "group": group,
-            "size": int(size),
-            "size_formatted": _format_size(int(size)),
-            "date": date,
-            "is_directory": perms.startswith('d'),
-            "is_link": perms.startswith('l')
-        }
-    
-    # Fallback: simple parsing
-    parts = line.split()
-    if len(parts) >= 8:
-        try:
-            size = int(parts[4])
-        except ValueError:
-            size = 0
-        return {
-            "name": " ".join(parts[7:]),
-            "permissions": parts[0],
             "size": size,
             "size_formatted": _format_size(size),
-            "is_directory": parts[0].startswith('d')
-        }
-    return None
+            "date": date,
+            "is_directory": kind == 'd',
+            "is_link": kind == 'l'
+        })
+    return entries
 
 
 # =============================================================================
@@ -101,27 +186,46 @@ def list_files(path: str, device_serial: Optional[str] = None) -> str:
     if error:
         return error
     
-    output = _file_manager.adb.shell(f"ls -la '{path}'", device_serial)
-    
-    if not output or "No such file" in output or "Permission denied" in output:
-        return json.dumps({
-            "success": False,
-            "error": output or f"Cannot access {path}",
-            "device": device_serial
-        })
-    
     files = []
     directories = []
     
-    for line in output.strip().split('\n'):
-        info = _parse_ls_line(line)
-        if info and info["name"] not in ['.', '..']:
-            if info.get("is_directory"):
+    # Tab-separated find rows need no ls format guessing. If find fails (e.g. a
+    # toybox without -printf) the same round-trip falls back to ls -la; no
+    # separate existence probe, a missing path just makes ls fail ('')
+    p = _q(path)
+    output = _file_manager.adb.shell(
+        f"{{ find {p} -mindepth 1 -maxdepth 1 -printf {_q(_FIND_PRINTF)} && echo FIND_DONE; }} 2>/dev/null"
+        f" || {{ echo LS_OUTPUT; ls -la {p}; }}",
+        device_serial
+    )
+    
+    if output.endswith("FIND_DONE"):
+        for info in _parse_find_output(output[:-len("FIND_DONE")]):
+            if info["is_directory"]:
                 directories.append(info)
             else:
                 files.append(info)
-    
-    return json.dumps({
+        # Match the name order ls lists entries in
+        directories.sort(key=itemgetter("name"))
+        files.sort(key=itemgetter("name"))
+    else:
+        output = output.partition('LS_OUTPUT\n')[2]
+        
+        if not output or "No such file" in output or "Permission denied" in output:
+            return _dumps({
+                "success": False,
+                "error": output or f"Cannot access {path}",
+                "device": device_serial
+            })
+        
+        for info in _parse_ls_output(output):
+            if info["name"] not in ['.', '..']:
+                if info.get("is_directory"):
+                    directories.append(info)
+                else:
+                    files.append(info)
+    
+    return _dumps({
         "success": True,
         "path": path,
         "directories": directories,
@@ -150,17 +254,34 @@ def pull_file(remote_path: str, local_path: str, device_serial: Optional[str] =
     
     local_path = os.path.expanduser(local_path)
     
+    # Like adb pull, a directory destination receives the file under its own name
+    remote_name = posixpath.basename(remote_path)
+    if remote_name and os.path.isdir(local_path):
+        local_path = os.path.join(local_path, remote_name)
+    
     # Create local directory if needed
     local_dir = os.path.dirname(local_path)
     if local_dir and not os.path.exists(local_dir):
         os.makedirs(local_dir)
     
-    adb = ADBClient(device_serial)
-    success, stdout, stderr = adb._run_adb(["pull", remote_path, local_path], timeout=300)
+    success, stdout, stderr = False, "", ""
+    
+    # Small files stream over exec-out; adb pull's sync framing only pays off for large ones
+    size_output = _file_manager.adb.shell(f"stat -c %s {_q(remote_path)}", device_serial)
+    if size_output.isdigit() and int(size_output) <= _EXEC_OUT_MAX_BYTES:
+        data = _file_manager.adb.exec_out(f"cat {_q(remote_path)}", device_serial, timeout=300)
+        if len(data) == int(size_output):
+            with open(local_path, "wb") as f:
+                f.write(data)
+            success = True
+    
+    if not success:
+        adb = ADBClient.get(device_serial)
+        success, stdout, stderr = adb._run_adb(["pull", remote_path, local_path], timeout=300)
     
     if success and os.path.exists(local_path):
         file_size = os.path.getsize(local_path)
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Successfully pulled file",
             "remote_path": remote_path,
@@ -170,7 +291,7 @@ def pull_file(remote_path: str, local_path: str, device_serial: Optional[str] =
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": stderr or stdout or "Failed to pull file",
             "device": device_serial
@@ -192,7 +313,7 @@ def push_file(local_path: str, remote_path: str, device_serial: Optional[str] =
     local_path = os.path.expanduser(local_path)
     
     if not os.path.exists(local_path):
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Local file not found: {local_path}"
         })
@@ -203,11 +324,10 @@ def push_file(local_path: str, remote_path: str, device_serial: Optional[str] =
     
     file_size = os.path.getsize(local_path)
     
-    adb = ADBClient(device_serial)
-    success, stdout, stderr = adb._run_adb(["push", local_path, remote_path], timeout=300)
+    [(success, push_error)] = ADBClient.get(device_serial).push_many([(local_path, remote_path)], device_serial)
     
     if success:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Successfully pushed file",
             "local_path": local_path,
@@ -217,13 +337,66 @@ def push_file(local_path: str, remote_path: str, device_serial: Optional[str] =
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
-            "error": stderr or stdout or "Failed to push file",
+            "error": push_error,
             "device": device_serial
         })
 
 
+@tool
+def push_files(pairs: List[List[str]], device_serial: Optional[str] = None) -> str:
+    """Push/upload several files from local machine to Android device in one go.
+    
+    Prefer this over repeated push_file calls when uploading many files.
+    
+    Args:
+        pairs: [local_path, remote_path] pairs (e.g., [['~/a.txt', '/sdcard/a.txt'], ['~/b.png', '/sdcard/']])
+        device_serial: Device serial number (optional, uses first device if not specified)
+    
+    Returns:
+        JSON string with one push result per file
+    """
+    device_serial, error = _get_device_serial(device_serial)
+    if error:
+        return error
+    
+    results = []
+    to_push = []
+    for pair in pairs:
+        if len(pair) != 2:
+            results.append({"pair": pair, "success": False, "error": "Expected a [local_path, remote_path] pair"})
+            continue
+        local_path, remote_path = pair
+        local_path = os.path.expanduser(local_path)
+        result = {"local_path": local_path, "remote_path": remote_path}
+        if os.path.exists(local_path):
+            to_push.append((local_path, remote_path, result))
+        else:
+            result.update(success=False, error=f"Local file not found: {local_path}")
+        results.append(result)
+    
+    if to_push:
+        outcomes = ADBClient.get(device_serial).push_many(
+            [(local_path, remote_path) for local_path, remote_path, _ in to_push], device_serial
+        )
+        for (local_path, _, result), (success, push_error) in zip(to_push, outcomes):
+            if success:
+                file_size = os.path.getsize(local_path)
+                result.update(success=True, size_bytes=file_size, size_formatted=_format_size(file_size))
+            else:
+                result.update(success=False, error=push_error)
+    
+    pushed = sum(1 for result in results if result["success"])
+    return _dumps({
+        "success": pushed == len(results),
+        "pushed": pushed,
+        "failed": len(results) - pushed,
+        "results": results,
+        "device": device_serial
+    })
+
+
 @tool
 def delete_file(path: str, device_serial: Optional[str] = None) -> str:
     """Delete a file or directory from Android device.
@@ -239,35 +412,30 @@ def delete_file(path: str, device_serial: Optional[str] = None) -> str:
     if error:
         return error
     
-    # Check if path exists
-    check = _file_manager.adb.shell(f"[ -e '{path}' ] && echo 'exists' || echo 'notfound'", device_serial)
+    # Existence check, delete and verification in one round-trip
+    p = _q(path)
+    status, output = _shell_status(
+        f"if [ ! -e {p} ]; then echo NOTFOUND; else "
+        f"if [ -d {p} ]; then rm -rf {p}; else rm {p}; fi 2>&1; "
+        f"[ -e {p} ] && echo FAIL || echo DELETED; fi",
+        device_serial
+    )
     
-    if "notfound" in check:
-        return json.dumps({
+    if status == "NOTFOUND":
+        return _dumps({
             "success": False,
             "error": f"Path not found: {path}",
             "device": device_serial
         })
     
-    # Check if directory
-    is_dir = _file_manager.adb.shell(f"[ -d '{path}' ] && echo 'dir' || echo 'file'", device_serial)
-    
-    if "dir" in is_dir:
-        output = _file_manager.adb.shell(f"rm -rf '{path}'", device_serial)
-    else:
-        output = _file_manager.adb.shell(f"rm '{path}'", device_serial)
-    
-    # Verify deletion
-    check = _file_manager.adb.shell(f"[ -e '{path}' ] && echo 'exists' || echo 'deleted'", device_serial)
-    
-    if "deleted" in check:
-        return json.dumps({
+    if status == "DELETED":
+        return _dumps({
             "success": True,
             "message": f"Successfully deleted {path}",
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": output or "Failed to delete",
             "device": device_serial
@@ -289,20 +457,21 @@ def create_directory(path: str, device_serial: Optional[str] = None) -> str:
     if error:
         return error
     
-    output = _file_manager.adb.shell(f"mkdir -p '{path}'", device_serial)
-    
-    # Verify creation
-    check = _file_manager.adb.shell(f"[ -d '{path}' ] && echo 'created' || echo 'failed'", device_serial)
+    # Create and verify in one round-trip
+    status, output = _shell_status(
+        f"mkdir -p {_q(path)} 2>&1; [ -d {_q(path)} ] && echo CREATED || echo FAILED",
+        device_serial
+    )
     
-    if "created" in check:
-        return json.dumps({
+    if status == "CREATED":
+        return _dumps({
             "success": True,
             "message": f"Successfully created directory {path}",
             "path": path,
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": output or "Failed to create directory",
             "device": device_serial
@@ -324,15 +493,14 @@ def file_exists(path: str, device_serial: Optional[str] = None) -> str:
     if error:
         return error
     
-    check = _file_manager.adb.shell(f"[ -e '{path}' ] && echo 'exists' || echo 'notfound'", device_serial)
-    exists = "exists" in check
-    
-    file_type = None
-    if exists:
-        type_check = _file_manager.adb.shell(f"[ -d '{path}' ] && echo 'directory' || echo 'file'", device_serial)
-        file_type = "directory" if "directory" in type_check else "file"
+    status, _ = _shell_status(
+        f"if [ -d {_q(path)} ]; then echo directory; elif [ -e {_q(path)} ]; then echo file; else echo none; fi",
+        device_serial
+    )
+    exists = status in ("directory", "file")
+    file_type = status if exists else None
     
-    return json.dumps({
+    return _dumps({
         "success": True,
         "exists": exists,
         "path": path,
@@ -357,35 +525,77 @@ def read_file(path: str, max_size: int = 100000, device_serial: Optional[str] =
     if error:
         return error
     
-    # Check if file exists
-    check = _file_manager.adb.shell(f"[ -f '{path}' ] && echo 'exists' || echo 'notfound'", device_serial)
+    # Existence check, size and (if it fits) content in one round-trip; the
+    # device only cats the file when it is within max_size
+    p = _q(path)
     
-    if "notfound" in check:
-        return json.dumps({
+    def read_script(reader: str) -> str:
+        return (
+            f"[ -f {p} ] || {{ echo NOTFOUND; exit; }}; "
+            f"size=$(stat -c %s {p}); echo \"$size\"; [ \"$size\" -gt {int(max_size)} ] 2>/dev/null || {reader}"
+        )
+    
+    # exec-out hands back the file's raw bytes, nothing stripped or re-encoded
+    data = _file_manager.adb.exec_out(read_script(f"cat {p} 2>/dev/null"), device_serial, timeout=60)
+    if data:
+        size_line, _, raw = data.partition(b'\n')
+    else:
+        # Devices too old for exec-out go through the shell session, whose
+        # text channel is not byte-clean, so the content travels as base64
+        # when the device has it; a mode line ahead of the content says which.
+        # Raw content is closed with a "." so trailing whitespace survives the
+        # session's stripping
+        reader = (
+            f"{{ if command -v base64 >/dev/null 2>&1; then echo B64; base64 {p} 2>/dev/null; "
+            f"else echo RAW; cat {p} 2>/dev/null; echo .; fi; }}"
+        )
+        size_line, _, rest = _file_manager.adb.shell(read_script(reader), device_serial).encode().partition(b'\n')
+        mode, _, body = rest.partition(b'\n')
+        if mode == b"B64":
+            try:
+                raw = base64.b64decode(body)
+            except binascii.Error:
+                raw = b""
+        elif mode == b"RAW" and body.endswith(b"."):
+            raw = body[:-1]
+        else:
+            raw = b""
+    size_line = size_line.decode(errors='replace')
+    content = raw.decode('utf-8', errors='replace')
+    
+    if size_line == "NOTFOUND":
+        return _dumps({
             "success": False,
             "error": f"File not found: {path}",
             "device": device_serial
         })
     
-    # Check file size
-    size_output = _file_manager.adb.shell(f"wc -c < '{path}'", device_serial)
     try:
-        file_size = int(size_output.strip())
+        file_size = int(size_line)
     except ValueError:
-        file_size = 0
+        return _dumps({
+            "success": False,
+            "error": f"Failed to read {path}",
+            "device": device_serial
+        })
     
     if file_size > max_size:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"File too large ({_format_size(file_size)}). Max: {_format_size(max_size)}. Use pull_file instead.",
             "size_bytes": file_size,
             "device": device_serial
         })
     
-    # Read file content
-    content = _file_manager.adb.shell(f"cat '{path}'", device_serial)
+    # A short read means cat failed part-way (e.g. permission denied)
+    if len(raw) != file_size:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to read {path}",
+            "device": device_serial
+        })
     
-    return json.dumps({
+    return _dumps({
         "success": True,
         "path": path,
         "content": content,
@@ -411,28 +621,22 @@ def write_file(path: str, content: str, device_serial: Optional[str] = None) ->
     if error:
         return error
     
-    # Create parent directory if needed
-    parent_dir = os.path.dirname(path)
-    if parent_dir:
-        _file_manager.adb.shell(f"mkdir -p '{parent_dir}'", device_serial)
+    data = content.encode('utf-8')
     
-    # Escape content for echo
-    escaped_content = content.replace("'", "'\\''")
-    
-    # Write content
-    _file_manager.adb.shell(f"echo '{escaped_content}' > '{path}'", device_serial)
-    
-    # Verify write
-    check = _file_manager.adb.shell(f"[ -f '{path}' ] && echo 'written' || echo 'failed'", device_serial)
+    # adb push streams the bytes over the sync protocol (no shell quoting or
+    # argv size limit) and creates missing parent directories itself
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(data)
+    try:
+        # The push carries the local mode over; temp files are created 0600
+        os.chmod(tmp.name, 0o644)
+        [(success, push_error)] = ADBClient.get(device_serial).push_many([(tmp.name, path)], device_serial)
+    finally:
+        os.unlink(tmp.name)
     
-    if "written" in check:
-        size_output = _file_manager.adb.shell(f"wc -c < '{path}'", device_serial)
-        try:
-            file_size = int(size_output.strip())
-        except ValueError:
-            file_size = len(content.encode('utf-8'))
-        
-        return json.dumps({
+    if success:
+        file_size = len(data)
+        return _dumps({
             "success": True,
             "message": f"Successfully wrote to {path}",
             "path": path,
@@ -441,9 +645,9 @@ def write_file(path: str, content: str, device_serial: Optional[str] = None) ->
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
-            "error": "Failed to write file",
+            "error": push_error or "Failed to write file",
             "device": device_serial
         })
 
@@ -463,61 +667,72 @@ def file_stats(path: str, device_serial: Optional[str] = None) -> str:
     if error:
         return error
     
-    # Check if exists
-    check = _file_manager.adb.shell(f"[ -e '{path}' ] && echo 'exists' || echo 'notfound'", device_serial)
+    # Type, stat fields and (for directories) entry counts in one round-trip
+    p = _q(path)
+    output = _file_manager.adb.shell(
+        f"if [ -d {p} ]; then echo directory; elif [ -e {p} ]; then echo file; else echo none; exit; fi; "
+        f"stat -c '%A|%U|%G|%s|%y' {p} 2>/dev/null || echo; "
+        f"if [ -d {p} ]; then find {p} -type f 2>/dev/null | wc -l; find {p} -type d 2>/dev/null | wc -l; fi",
+        device_serial
+    )
+    lines = output.split('\n')
     
-    if "notfound" in check:
-        return json.dumps({
+    if lines[0] not in ("directory", "file"):
+        return _dumps({
             "success": False,
             "error": f"Path not found: {path}",
             "device": device_serial
         })
     
-    # Get type
-    type_check = _file_manager.adb.shell(f"[ -d '{path}' ] && echo 'directory' || echo 'file'", device_serial)
-    is_directory = "directory" in type_check
-    
-    # Get ls info
-    ls_output = _file_manager.adb.shell(f"ls -la '{path}'", device_serial)
-    
+    is_directory = lines[0] == "directory"
     stats = {
         "success": True,
         "path": path,
-        "type": "directory" if is_directory else "file",
+        "type": lines[0],
         "device": device_serial
     }
     
-    # Parse first relevant line
-    for line in ls_output.strip().split('\n'):
-        info = _parse_ls_line(line)
-        if info:
-            stats.update({
-                "permissions": info.get("permissions"),
-                "owner": info.get("owner"),
-                "group": info.get("group"),
-                "size_bytes": info.get("size"),
-                "size_formatted": info.get("size_formatted"),
-                "modified": info.get("date")
-            })
-            break
+    fields = lines[1].split('|') if len(lines) > 1 else []
+    if len(fields) == 5 and fields[3].isdigit():
+        perms, owner, group, size, modified = fields
+        stats.update({
+            "permissions": perms,
+            "owner": owner,
+            "group": group,
+            "size_bytes": int(size),
+            "size_formatted": _format_size(int(size)),
+            "modified": modified[:16]  # "YYYY-MM-DD HH:MM", as ls -l shows it
+        })
     
     # For directories, get counts
-    if is_directory:
+    if is_directory and len(lines) >= 4:
         try:
-            file_count = _file_manager.adb.shell(f"find '{path}' -type f 2>/dev/null | wc -l", device_serial)
-            dir_count = _file_manager.adb.shell(f"find '{path}' -type d 2>/dev/null | wc -l", device_serial)
-            stats["file_count"] = int(file_count.strip())
-            stats["directory_count"] = max(0, int(dir_count.strip()) - 1)  # Exclude self
+            stats["file_count"] = int(lines[2].strip())
+            stats["directory_count"] = max(0, int(lines[3].strip()) - 1)  # Exclude self
         except ValueError:
             pass
     
-    return json.dumps(stats)
+    return _dumps(stats)
 
 
 # =============================================================================
 # APP DATABASE OPERATIONS
 # =============================================================================
 
+def _pull_via_exec_out(command: str, local_path: str, device_serial: str, timeout: int) -> tuple[bool, str]:
+    """Stream a command's stdout into local_path, keeping the file only if data arrived.
+    
+    Returns:
+        (success, adb error message)
+    """
+    success, error = _file_manager.adb.exec_out_to_file(command, local_path, device_serial, timeout)
+    if success and os.path.getsize(local_path) > 0:
+        return True, ""
+    if os.path.exists(local_path):
+        os.unlink(local_path)
+    return False, error
+
+
 @tool
 def list_app_databases(package_name: str, device_serial: Optional[str] = None) -> str:
     """List all database files for an Android app.
@@ -535,37 +750,33 @@ def list_app_databases(package_name: str, device_serial: Optional[str] = None) -
     if error:
         return error
     
-    adb = ADBClient(device_serial)
     databases = []
     method_used = None
     
+    # Both probes go through the device's persistent shell session; shell()
+    # returns '' when the command fails (e.g. run-as on a non-debuggable app)
+    
     # Method 1: Try run-as (works for debuggable apps)
-    success, stdout, stderr = adb._run_adb([
-        "shell", "run-as", package_name, "ls", "-la", "databases/"
-    ], timeout=30)
+    stdout = _file_manager.adb.shell(f"run-as {_q(package_name)} ls -la databases/", device_serial)
     
-    if success and stdout and "not debuggable" not in stderr.lower():
+    if stdout and "not debuggable" not in stdout.lower():
         method_used = "run-as"
-        for line in stdout.strip().split('\n'):
-            info = _parse_ls_line(line)
-            if info and info["name"] not in ['.', '..']:
+        for info in _parse_ls_output(stdout):
+            if info["name"] not in ['.', '..']:
                 databases.append(info)
     else:
         # Method 2: Try with su (requires root)
         db_path = f"/data/data/{package_name}/databases/"
-        success, stdout, stderr = adb._run_adb([
-            "shell", "su", "-c", f"ls -la {db_path}"
-        ], timeout=30)
+        stdout = _file_manager.adb.shell(f"su -c {_q(f'ls -la {_q(db_path)}')}", device_serial)
         
-        if success and stdout and "Permission denied" not in stdout:
+        if stdout and "Permission denied" not in stdout:
             method_used = "root"
-            for line in stdout.strip().split('\n'):
-                info = _parse_ls_line(line)
-                if info and info["name"] not in ['.', '..']:
+            for info in _parse_ls_output(stdout):
+                if info["name"] not in ['.', '..']:
                     databases.append(info)
     
     if not databases:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": "Cannot list databases. App may not be debuggable and device may not be rooted.",
             "package": package_name,
@@ -576,7 +787,7 @@ def list_app_databases(package_name: str, device_serial: Optional[str] = None) -
     db_files = [db for db in databases if db["name"].endswith(('.db', '.sqlite', '.sqlite3')) 
                 or '-journal' not in db["name"]]
     
-    return json.dumps({
+    return _dumps({
         "success": True,
         "package": package_name,
         "databases": db_files,
@@ -617,71 +828,38 @@ def pull_app_database(
     
     # Paths
     db_remote_path = f"/data/data/{package_name}/databases/{db_name}"
-    temp_path = f"/sdcard/temp_{package_name}_{db_name}"
     local_path = os.path.join(local_dir, f"{package_name}_{db_name}")
     
-    adb = ADBClient(device_serial)
-    method_used = None
+    # Each method streams the file over exec-out straight into local_path:
+    # one round-trip, no /sdcard staging copy to chmod, pull and delete.
+    # stderr is discarded on the device so only file bytes reach us.
+    def read_command(method: str, suffix: str = "") -> str:
+        if method == "run-as":
+            return f"run-as {_q(package_name)} cat {_q(f'databases/{db_name}{suffix}')} 2>/dev/null"
+        return f"su -c {_q(f'cat {_q(db_remote_path + suffix)}')} 2>/dev/null"
     
-    # Method 1: Try run-as (works for debuggable apps)
-    success, stdout, stderr = adb._run_adb([
-        "shell", "run-as", package_name, "cat", f"databases/{db_name}"
-    ], timeout=60)
-    
-    if success and stdout and "not debuggable" not in stderr.lower():
-        # Write directly using run-as + cat piped to sdcard
-        success, stdout, stderr = adb._run_adb([
-            "shell", f"run-as {package_name} cat databases/{db_name} > {temp_path}"
-        ], timeout=60)
-        method_used = "run-as"
-    
-    if not method_used:
-        # Method 2: Try with su (requires root)
-        success, stdout, stderr = adb._run_adb([
-            "shell", "su", "-c", f"cp {db_remote_path} {temp_path}"
-        ], timeout=60)
-        
-        if success:
-            method_used = "root"
+    method_used = None
+    details = ""
     
-    if not method_used:
-        # Method 3: Try run-as with cp
-        success, stdout, stderr = adb._run_adb([
-            "shell", "run-as", package_name, "cp", f"databases/{db_name}", temp_path
-        ], timeout=60)
-        
+    # Method 1: run-as (works for debuggable apps); Method 2: su (requires root)
+    for method in ("run-as", "root"):
+        success, details = _pull_via_exec_out(read_command(method), local_path, device_serial, timeout=120)
         if success:
-            method_used = "run-as-cp"
-    
-    # Make temp file readable and pull
-    adb._run_adb(["shell", "chmod", "644", temp_path], timeout=10)
-    success, stdout, stderr = adb._run_adb(["pull", temp_path, local_path], timeout=120)
-    
-    # Cleanup temp file
-    adb._run_adb(["shell", "rm", "-f", temp_path], timeout=10)
+            method_used = method
+            break
     
-    if success and os.path.exists(local_path):
+    if method_used:
         file_size = os.path.getsize(local_path)
         
-        # Also try to pull journal/wal files if they exist
-        for suffix in ['-journal', '-wal', '-shm']:
-            journal_temp = f"/sdcard/temp_{package_name}_{db_name}{suffix}"
-            journal_local = f"{local_path}{suffix}"
-            
-            if method_used == "run-as":
-                adb._run_adb([
-                    "shell", f"run-as {package_name} cat databases/{db_name}{suffix} > {journal_temp} 2>/dev/null"
-                ], timeout=30)
-            elif method_used == "root":
-                adb._run_adb([
-                    "shell", "su", "-c", f"cp {db_remote_path}{suffix} {journal_temp} 2>/dev/null"
-                ], timeout=30)
-            
-            adb._run_adb(["shell", "chmod", "644", journal_temp], timeout=5)
-            adb._run_adb(["pull", journal_temp, journal_local], timeout=30)
-            adb._run_adb(["shell", "rm", "-f", journal_temp], timeout=5)
+        # Also try to pull journal/wal files if they exist; each is its own
+        # adb process, so the three streams run side by side
+        def pull_sibling(suffix: str) -> tuple[bool, str]:
+            return _pull_via_exec_out(read_command(method_used, suffix), f"{local_path}{suffix}", device_serial, timeout=30)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(pull_sibling, ['-journal', '-wal', '-shm']))
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Successfully pulled database",
             "package": package_name,
@@ -693,10 +871,10 @@ def pull_app_database(
             "device": device_serial
         })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": "Failed to pull database. App may not be debuggable and device may not be rooted.",
-            "details": stderr or stdout,
+            "details": details,
             "package": package_name,
             "database": db_name,
             "device": device_serial
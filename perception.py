@@ -125,28 +125,19 @@ class Perception:
         """Fallback: Direct ADB screenshot"""
         import subprocess
         
-        device_temp = "/sdcard/vla_screenshot.png"
-        
-        # Capture on device
+        # Stream the PNG straight off the device: one round-trip, no temp
+        # file on /sdcard to write, pull and delete
         cmd = ["adb"]
         if device_serial:
             cmd.extend(["-s", device_serial])
-        cmd.extend(["shell", "screencap", "-p", device_temp])
-        subprocess.run(cmd, check=True, capture_output=True)
+        cmd.extend(["exec-out", "screencap", "-p"])
         
-        # Pull to local
-        cmd = ["adb"]
-        if device_serial:
-            cmd.extend(["-s", device_serial])
-        cmd.extend(["pull", device_temp, output_path])
-        subprocess.run(cmd, check=True, capture_output=True)
+        with open(output_path, "wb") as f:
+            subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True, timeout=15)
         
-        # Cleanup device
-        cmd = ["adb"]
-        if device_serial:
-            cmd.extend(["-s", device_serial])
-        cmd.extend(["shell", "rm", device_temp])
-        subprocess.run(cmd, capture_output=True)
+        with open(output_path, "rb") as f:
+            if f.read(8) != b"\x89PNG\r\n\x1a\n":
+                raise Exception("Screenshot failed: adb returned no PNG data")
         
         return output_path
     
@@ -7,10 +7,12 @@ This is the "Brain" of the VLA pipeline.
 Takes UI state from Perception and decides the next action.
 """
 
+from __future__ import annotations
+
 import json
 import sys
 import os
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from dataclasses import dataclass
 
 import requests
@@ -24,9 +26,12 @@ from .config import (
     LLM_CONFIG,
     VLA_CONFIG,
 )
-from .perception import UIState
 from .executor import Action, ActionType
 
+if TYPE_CHECKING:
+    # Only used in annotations; perception pulls in Pillow
+    from .perception import UIState
+
 
 @dataclass
 class PlannerContext:
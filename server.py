@@ -11,6 +11,7 @@ import sys
 import os
 from typing import Optional, List
 from enum import Enum
+from dataclasses import asdict
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, ConfigDict
@@ -241,7 +242,7 @@ def format_search_results(results: dict, fmt: ResponseFormat) -> str:
 def format_page_content(page: PageContent, fmt: ResponseFormat) -> str:
     """Format page content for output."""
     if fmt == ResponseFormat.JSON:
-        return json.dumps(vars(page), indent=2)
+        return json.dumps(asdict(page), indent=2)
     
     # Markdown format
     lines = [
@@ -395,7 +396,7 @@ async def confluence_get_page_text(params: GetPageTextInput) -> str:
         Plain text content of the page
     """
     client = get_client()
-    return client.get_page_text_only(
+    return await client.aget_page_text_only(
         page_id=params.page_id,
         space_key=params.space_key,
         title=params.title
@@ -429,7 +430,7 @@ async def confluence_get_page_images(params: GetPageImagesInput) -> str:
         JSON array of images with base64 data and media types
     """
     client = get_client()
-    images = client.get_page_images_base64(params.page_id)
+    images = await client.aget_page_images_base64(params.page_id)
     
     # Return summary + JSON
     result = {
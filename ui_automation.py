@@ -1,6 +1,7 @@
 """UI Automation tools for Android devices."""
 import json
-from typing import Optional
+from shlex import quote as _q
+from typing import Optional, Tuple
 from langchain_core.tools import tool
 from .adb_client import ADBClient
 
@@ -9,11 +10,36 @@ class UIAutomation:
     """Manager for UI automation."""
     
     def __init__(self):
-        self.adb = ADBClient()
+        self.adb = ADBClient.get()
 
 
 _ui = UIAutomation()
 
+# Printed after an input command, followed by its exit status; see _run_input()
+_RC_MARKER = "__RC__"
+
+
+def _input_command(*args) -> str:
+    """`input ...` shell command with every argument quoted."""
+    return "input " + " ".join(_q(str(arg)) for arg in args)
+
+
+def _run_input(device_serial: str, command: str) -> Tuple[bool, str]:
+    """
+    Run an input command through the device's persistent shell session.
+    
+    The exit status is echoed after the command, so a silent success can be
+    told apart from a failed adb call (which returns nothing at all).
+    
+    Returns:
+        (success, command output or error message)
+    """
+    output = ADBClient.get(device_serial).shell(f"{command} 2>&1; echo {_RC_MARKER}$?", device_serial)
+    text, marker, code = output.rpartition(_RC_MARKER)
+    if not marker:
+        return False, "No response from device"
+    return code == "0", text.strip()
+
 
 @tool
 def tap(x: int, y: int, device_serial: Optional[str] = None) -> str:
@@ -34,11 +60,10 @@ def tap(x: int, y: int, device_serial: Optional[str] = None) -> str:
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        success, stdout, stderr = adb._run_adb(["shell", "input", "tap", str(x), str(y)])
+        success, output = _run_input(device_serial, _input_command("tap", x, y))
         
         if not success:
-            return json.dumps({"success": False, "error": f"Tap failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Tap failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -71,15 +96,11 @@ def long_press(x: int, y: int, duration_ms: int = 1000, device_serial: Optional[
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
         # Long press is a swipe from point to same point with duration
-        success, stdout, stderr = adb._run_adb([
-            "shell", "input", "swipe", 
-            str(x), str(y), str(x), str(y), str(duration_ms)
-        ])
+        success, output = _run_input(device_serial, _input_command("swipe", x, y, x, y, duration_ms))
         
         if not success:
-            return json.dumps({"success": False, "error": f"Long press failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Long press failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -122,14 +143,12 @@ def swipe(
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        success, stdout, stderr = adb._run_adb([
-            "shell", "input", "swipe",
-            str(start_x), str(start_y), str(end_x), str(end_y), str(duration_ms)
-        ])
+        success, output = _run_input(
+            device_serial, _input_command("swipe", start_x, start_y, end_x, end_y, duration_ms)
+        )
         
         if not success:
-            return json.dumps({"success": False, "error": f"Swipe failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Swipe failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -172,22 +191,16 @@ def drag(
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        # Drag is essentially a slow swipe
-        success, stdout, stderr = adb._run_adb([
-            "shell", "input", "draganddrop",
-            str(start_x), str(start_y), str(end_x), str(end_y), str(duration_ms)
-        ])
-        
-        # Fallback to swipe if draganddrop not supported (older Android)
-        if not success:
-            success, stdout, stderr = adb._run_adb([
-                "shell", "input", "swipe",
-                str(start_x), str(start_y), str(end_x), str(end_y), str(duration_ms)
-            ])
+        # Drag is essentially a slow swipe; fall back to swipe (same round-trip)
+        # if draganddrop is not supported (older Android)
+        coords = (start_x, start_y, end_x, end_y, duration_ms)
+        success, output = _run_input(
+            device_serial,
+            f"{_input_command('draganddrop', *coords)} >/dev/null 2>&1 || {_input_command('swipe', *coords)}"
+        )
         
         if not success:
-            return json.dumps({"success": False, "error": f"Drag failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Drag failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -219,19 +232,12 @@ def input_text(text: str, device_serial: Optional[str] = None) -> str:
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        
-        # Escape special characters for shell
-        # Replace spaces with %s (ADB input text format)
-        escaped_text = text.replace(" ", "%s")
-        # Escape other special characters
-        for char in ["'", '"', "\\", "&", "|", ";", "$", "`", "(", ")", "<", ">"]:
-            escaped_text = escaped_text.replace(char, f"\\{char}")
-        
-        success, stdout, stderr = adb._run_adb(["shell", "input", "text", escaped_text])
+        # Replace spaces with %s (ADB input text format); _input_command quotes
+        # the rest, so shell special characters need no escaping
+        success, output = _run_input(device_serial, _input_command("text", text.replace(" ", "%s")))
         
         if not success:
-            return json.dumps({"success": False, "error": f"Input text failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Input text failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -275,17 +281,15 @@ def press_key(keycode: str, longpress: bool = False, device_serial: Optional[str
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        
-        cmd = ["shell", "input", "keyevent"]
+        args = ["keyevent"]
         if longpress:
-            cmd.append("--longpress")
-        cmd.append(str(keycode))
+            args.append("--longpress")
+        args.append(keycode)
         
-        success, stdout, stderr = adb._run_adb(cmd)
+        success, output = _run_input(device_serial, _input_command(*args))
         
         if not success:
-            return json.dumps({"success": False, "error": f"Key press failed: {stderr}"})
+            return json.dumps({"success": False, "error": f"Key press failed: {output}"})
         
         return json.dumps({
             "success": True,
@@ -318,25 +322,22 @@ def get_ui_hierarchy(device_serial: Optional[str] = None) -> str:
         device_serial = devices[0].get('serial') if isinstance(devices[0], dict) else devices[0]
     
     try:
-        adb = ADBClient(device_serial)
-        
-        # Dump UI hierarchy to device temp file
+        # Dump, read back and clean up the device temp file in one round-trip;
+        # the shell session drops stderr, so device errors are folded into stdout
         device_temp = "/sdcard/ui_dump.xml"
-        success, stdout, stderr = adb._run_adb([
-            "shell", "uiautomator", "dump", device_temp
-        ])
+        dump, read, _ = _ui.adb.shell_batch([
+            f"uiautomator dump {device_temp} 2>&1",
+            f"cat {device_temp} 2>&1",
+            f"rm {device_temp}",
+        ], device_serial)
         
+        success, stdout, stderr = dump
         if not success:
-            return json.dumps({"success": False, "error": f"UI dump failed: {stderr}"})
-        
-        # Read the dump file
-        success, stdout, stderr = adb._run_adb(["shell", "cat", device_temp])
+            return json.dumps({"success": False, "error": f"UI dump failed: {stdout or stderr}"})
         
+        success, stdout, stderr = read
         if not success:
-            return json.dumps({"success": False, "error": f"Failed to read UI dump: {stderr}"})
-        
-        # Clean up
-        adb._run_adb(["shell", "rm", device_temp])
+            return json.dumps({"success": False, "error": f"Failed to read UI dump: {stdout or stderr}"})
         
         return json.dumps({
             "success": True,